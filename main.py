@@ -19,33 +19,106 @@
 - 命令行参数支持
 
 使用示例:
-    python main_optimized.py                    # 使用默认配置
-    python main_optimized.py -m 5               # 获取前5条数据
-    python main_optimized.py -i 2               # 请求间隔2秒
-    python main_optimized.py -p                 # 显示详细性能信息
-    python main_optimized.py -f csv -o result.csv  # CSV格式输出
-    python main_optimized.py -d -p              # 调试+性能监控模式
+    python main.py                       # 使用默认配置
+    python main.py -m 5                  # 获取前5条数据
+    python main.py -i 2                  # 请求间隔2秒
+    python main.py -p                    # 显示详细性能信息
+    python main.py -f csv -o result.csv  # CSV格式输出
+    python main.py -d -p                 # 调试+性能监控模式
 """
 
+import os
 import sys
+import json
+import logging
 import argparse
+import functools
+import operator
 import traceback
 from pathlib import Path
-from datetime import datetime
+from typing import TYPE_CHECKING
+
+# orjson 为可选依赖，存在时用于加速JSON输出
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 # 添加src目录到Python路径，确保能够导入自定义模块
-sys.path.insert(0, str(Path(__file__).parent / "src"))
+_SRC_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "src")
+if _SRC_DIR not in sys.path:
+    sys.path.insert(0, _SRC_DIR)
 
-from src.config.config_manager import ConfigManager
-from src.utils.logger import LogManager, setup_logging
-from src.utils.performance import PerformanceMonitor, CacheManager, RateLimiter
-from src.core.models import HotListResponse, CrawlResult
-from src.spider.douyin_spider import DouyinSpider
+from src.utils.lazy_loader import LazyLoader
 
+# 重量级模块（配置、日志、爬虫、性能监控）延迟到 main() 中按需导入，
+# 使 --help / --version / --dry-run 等路径无需加载浏览器爬虫依赖
+if TYPE_CHECKING:
+    from src.config.config_manager import ConfigManager
+    from src.core.models import CrawlResult
 
-def parse_arguments() -> argparse.Namespace:
+# 版本信息，供 --version 快速路径与参数解析器共用
+VERSION_STRING = "抖音热榜爬虫 v1.0.0 (优化版本)"
+
+# 详细性能统计中依次读取的统计项
+_PERF_STATS_GETTER = operator.itemgetter(
+    'total_time', 'request_count', 'success_count', 'error_count', 'success_rate',
+    'avg_request_time', 'requests_per_second', 'min_request_time', 'max_request_time',
+    'memory_usage', 'max_memory', 'cpu_usage', 'max_cpu'
+)
+
+# CSV/TXT/Markdown 格式化模块延迟加载，JSON 输出路径不会导入
+formatters = LazyLoader("src.utils.formatters")
+
+# 配置模块延迟加载，供输出阶段渲染默认文件名
+config_manager_module = LazyLoader("src.config.config_manager")
+
+
+def _sniff_fastpath() -> None:
     """
-    解析命令行参数
+    命令行快速路径检测
+    
+    在构建完整参数解析器之前检查 sys.argv，当仅请求版本信息时
+    直接输出版本号并退出，无需构建解析器。
+    帮助信息需要完整的参数列表，因此 -h/--help 仍走完整解析器。
+    
+    @returns {None}
+    @throws {SystemExit} 命中 --version 快速路径时退出程序
+    
+    @example
+        _sniff_fastpath()
+        args = parse_arguments()
+    """
+    argv = sys.argv[1:]
+    if len(argv) == 1 and argv[0] in ('-v', '--version'):
+        print(VERSION_STRING)
+        sys.exit(0)
+
+
+# 命令行帮助信息中的使用示例，模块导入时构建一次
+_EPILOG = """
+使用示例:
+  python main.py                         # 使用默认配置
+  python main.py -m 5                    # 获取前5条数据
+  python main.py -i 2                    # 请求间隔2秒
+  python main.py -m 10 -i 1.5            # 获取10条，间隔1.5秒
+  python main.py --no-skip-top           # 不跳过热榜置顶
+  python main.py --headless              # 浏览器后台运行
+  python main.py --download-videos       # 启用视频下载
+  python main.py -d                      # 开启调试模式
+  python main.py -p                      # 显示详细性能信息
+  python main.py -f csv -o result.csv    # CSV格式输出
+  python main.py -f txt -o -             # TXT格式输出到控制台
+  python main.py --dry-run               # 试运行模式
+  python main.py -v                      # 显示版本信息
+  python main.py -h                      # 显示帮助信息
+        """
+
+
+@functools.lru_cache(maxsize=1)
+def _build_parser() -> argparse.ArgumentParser:
+    """
+    构建命令行参数解析器
     
     创建并配置命令行参数解析器，支持多种参数选项：
     - 数据获取参数：控制爬取的数量和间隔
@@ -53,30 +126,14 @@ def parse_arguments() -> argparse.Namespace:
     - 调试参数：控制日志级别和性能监控
     - 其他参数：版本信息等
     
-    @returns {argparse.Namespace} 解析后的命令行参数对象
-    @example
-        args = parse_arguments()
-        print(args.max_items)  # 获取最大项目数参数
+    解析器构建结果会被缓存，重复调用直接返回同一实例。
+    
+    @returns {argparse.ArgumentParser} 参数解析器
     """
     parser = argparse.ArgumentParser(
         description="抖音热榜爬虫 - 优化版本",
         formatter_class=argparse.RawDescriptionHelpFormatter,
-        epilog="""
-使用示例:
-  python main_optimized.py                         # 使用默认配置
-  python main_optimized.py -m 5                    # 获取前5条数据
-  python main_optimized.py -i 2                    # 请求间隔2秒
-  python main_optimized.py -m 10 -i 1.5           # 获取10条，间隔1.5秒
-  python main_optimized.py --no-skip-top          # 不跳过热榜置顶
-  python main_optimized.py --headless             # 浏览器后台运行
-  python main_optimized.py --download-videos      # 启用视频下载
-  python main_optimized.py -d                     # 开启调试模式
-  python main_optimized.py -p                     # 显示详细性能信息
-  python main_optimized.py -f csv -o result.csv   # CSV格式输出
-  python main_optimized.py --dry-run              # 试运行模式
-  python main_optimized.py -v                     # 显示版本信息
-  python main_optimized.py -h                     # 显示帮助信息
-        """
+        epilog=_EPILOG
     )
     
     # 数据获取参数组
@@ -120,7 +177,7 @@ def parse_arguments() -> argparse.Namespace:
     parser.add_argument(
         '-o', '--output',
         type=str,
-        help='输出文件路径 (默认: 输出到控制台)'
+        help='输出文件路径，"-" 表示输出到控制台 (默认: 保存到配置的默认输出目录)'
     )
     
     parser.add_argument(
@@ -153,13 +210,41 @@ def parse_arguments() -> argparse.Namespace:
     parser.add_argument(
         '-v', '--version',
         action='version',
-        version='抖音热榜爬虫 v1.0.0 (优化版本)'
+        version=VERSION_STRING
     )
     
-    return parser.parse_args()
+    return parser
+
+
+def parse_arguments() -> argparse.Namespace:
+    """
+    解析命令行参数
+    
+    仅请求版本信息时由 _sniff_fastpath() 提前返回，不构建解析器；
+    其余情况使用 _build_parser() 缓存的解析器进行解析。
+    
+    @returns {argparse.Namespace} 解析后的命令行参数对象
+    @example
+        args = parse_arguments()
+        print(args.max_items)  # 获取最大项目数参数
+    """
+    _sniff_fastpath()
+    return _build_parser().parse_args()
+
+
+# 命令行参数到配置项的映射：(参数属性名, 配置项名, 开关取值)
+# 开关取值为None表示取值型参数，否则为开关型参数开启时写入的配置值
+_ARG_CONFIG_MAP = (
+    ('max_items', 'max_items', None),
+    ('interval', 'request_interval', None),
+    ('no_skip_top', 'skip_top_item', False),
+    ('headless', 'browser_headless', True),
+    ('download_videos', 'video_download_enabled', True),
+    ('download_dir', 'video_download_dir', None),
+)
 
 
-def apply_command_line_args(config_manager: ConfigManager, args: argparse.Namespace) -> None:
+def apply_command_line_args(config_manager: "ConfigManager", args: argparse.Namespace) -> None:
     """
     应用命令行参数到配置管理器
     
@@ -177,35 +262,22 @@ def apply_command_line_args(config_manager: ConfigManager, args: argparse.Namesp
     """
     config_updates = {}
     
-    # 更新最大项目数配置
-    if args.max_items is not None:
-        config_updates['max_items'] = args.max_items
-        
-    # 更新请求间隔配置
-    if args.interval is not None:
-        config_updates['request_interval'] = args.interval
-        
-    # 更新是否跳过置顶配置
-    if args.no_skip_top:
-        config_updates['skip_top_item'] = False
-    
-    # 更新浏览器无头模式配置
-    if args.headless:
-        config_updates['browser_headless'] = True
-    
-    # 更新视频下载配置
-    if args.download_videos:
-        config_updates['video_download_enabled'] = True
-    
-    if args.download_dir is not None:
-        config_updates['video_download_dir'] = args.download_dir
+    for arg_name, config_key, flag_value in _ARG_CONFIG_MAP:
+        value = getattr(args, arg_name)
+        if flag_value is None:
+            # 取值型参数：非None时使用参数值
+            if value is not None:
+                config_updates[config_key] = value
+        elif value:
+            # 开关型参数：开启时写入固定取值
+            config_updates[config_key] = flag_value
     
     # 批量更新配置
     if config_updates:
         config_manager.update_config(**config_updates)
 
 
-def setup_environment(config_manager: ConfigManager, args: argparse.Namespace) -> tuple:
+def setup_environment(config_manager: "ConfigManager", args: argparse.Namespace) -> tuple:
     """
     设置运行环境
     
@@ -223,11 +295,11 @@ def setup_environment(config_manager: ConfigManager, args: argparse.Namespace) -
         args = parse_arguments()
         config, logger = setup_environment(config_manager, args)
     """
-    # 加载配置
-    config = config_manager.get_config()
+    from src.utils.logger import LogManager, setup_logging
     
-    # 应用命令行参数覆盖
+    # 加载配置并应用命令行参数覆盖（配置对象不可变，需在覆盖后获取）
     apply_command_line_args(config_manager, args)
+    config = config_manager.get_config()
     
     # 设置日志配置
     log_config = {
@@ -239,8 +311,8 @@ def setup_environment(config_manager: ConfigManager, args: argparse.Namespace) -
         "backup_count": config.log_backup_count,
         "format": config.log_format,
         "date_format": config.log_date_format,
-        "cleanup_old_logs": getattr(config, 'cleanup_old_logs', True),
-        "log_retention_days": getattr(config, 'log_retention_days', 7)
+        "cleanup_old_logs": config.cleanup_old_logs,
+        "log_retention_days": config.log_retention_days
     }
     
     # 初始化日志系统
@@ -250,13 +322,53 @@ def setup_environment(config_manager: ConfigManager, args: argparse.Namespace) -
     return config, logger
 
 
-def output_result(result: CrawlResult, args: argparse.Namespace, config) -> None:
+def _use_orjson(config) -> bool:
+    """
+    判断当前输出配置能否使用 orjson 序列化
+    
+    orjson 只支持2空格缩进且始终输出UTF-8原文，因此仅在
+    output_indent 为2且不要求 ensure_ascii 时使用，其余情况回退到标准库。
+    
+    @param {object} config - 配置对象
+    @returns {bool} 是否使用 orjson
+    """
+    return orjson is not None and not config.ensure_ascii and config.output_indent == 2
+
+
+def _dump_json(data, config) -> str:
+    """
+    将热榜响应序列化为JSON字符串
+    
+    @param {HotListResponse} data - 热榜响应数据对象
+    @param {object} config - 配置对象，提供 ensure_ascii 与 output_indent
+    @returns {str} JSON格式的字符串
+    """
+    if _use_orjson(config):
+        return data.to_json_bytes(indent=2).decode('utf-8')
+    return json.dumps(
+        data.to_dict(),
+        ensure_ascii=config.ensure_ascii,
+        indent=config.output_indent
+    )
+
+
+# 输出格式分发表：格式名 -> (data, config) -> str
+_FORMAT_DISPATCH = {
+    'json': _dump_json,
+    'csv': lambda data, config: formatters.convert_to_csv(data),
+    'txt': lambda data, config: formatters.convert_to_txt(data),
+    'markdown': lambda data, config: formatters.convert_to_markdown(data),
+}
+
+
+def output_result(result: "CrawlResult", args: argparse.Namespace, config) -> None:
     """
     输出爬取结果
     
     根据指定的格式将爬取结果输出到文件或控制台。
     支持多种输出格式：JSON、CSV、TXT、Markdown。
-    如果未指定输出文件，将使用默认路径和文件名模板。
+    如果未指定输出文件，将使用默认路径和文件名模板；
+    输出路径为 "-" 时直接写到标准输出。
     
     @param {CrawlResult} result - 爬取结果对象
     @param {argparse.Namespace} args - 命令行参数
@@ -272,59 +384,50 @@ def output_result(result: CrawlResult, args: argparse.Namespace, config) -> None
         print("未获取到有效数据")
         return
     
-    # 根据输出格式生成结果数据
-    if args.format == 'json':
-        import json
-        result_data = json.dumps(
-            result.data.to_dict(), 
-            ensure_ascii=config.ensure_ascii, 
-            indent=config.output_indent
-        )
-    elif args.format == 'csv':
-        from src.utils.formatters import convert_to_csv
-        result_data = convert_to_csv(result.data)
-    elif args.format == 'txt':
-        from src.utils.formatters import convert_to_txt
-        result_data = convert_to_txt(result.data)
-    elif args.format == 'markdown':
-        from src.utils.formatters import convert_to_markdown
-        result_data = convert_to_markdown(result.data)
-    else:
-        # 默认使用JSON格式
-        import json
-        result_data = json.dumps(
-            result.data.to_dict(), 
-            ensure_ascii=config.ensure_ascii, 
-            indent=config.output_indent
-        )
+    # 根据输出格式选择格式化函数，未知格式回退到JSON
+    formatter = _FORMAT_DISPATCH.get(args.format, _dump_json)
     
-    # 确定输出文件路径
-    output_path = args.output
-    if not output_path:
-        # 使用默认输出路径和文件名模板
-        from datetime import datetime
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        filename = config.output_filename_template.replace("{timestamp}", timestamp)
-        filename = f"{filename}.{args.format}"
-        
-        # 确保输出目录存在
-        output_dir = Path(config.output_default_path)
-        output_dir.mkdir(exist_ok=True)
-        
-        output_path = output_dir / filename
+    # JSON格式写文件时直接流式写入，不生成中间字符串
+    stream_json = formatter is _dump_json
+    result_data = None if stream_json else formatter(result.data, config)
+    
+    # 输出路径为 "-" 时直接写到标准输出，不涉及任何文件系统操作
+    if args.output == '-':
+        sys.stdout.write(_dump_json(result.data, config) if stream_json else result_data)
+        sys.stdout.write('\n')
+        return
     
     # 输出到文件或控制台
     try:
-        # 确保输出目录存在
+        # 确定输出文件路径
+        output_path = args.output
+        if not output_path:
+            # 使用默认输出路径和文件名模板
+            filename = f"{config_manager_module.render_output_filename(config.output_filename_template)}.{args.format}"
+            output_path = Path(config.output_default_path) / filename
+        
+        # 确保输出目录存在（默认路径与自定义路径统一在此创建，只调用一次）
         output_file = Path(output_path)
         output_file.parent.mkdir(parents=True, exist_ok=True)
         
-        with open(output_file, 'w', encoding='utf-8') as f:
-            f.write(result_data)
+        if stream_json and _use_orjson(config):
+            output_file.write_bytes(result.data.to_json_bytes(indent=2))
+        elif stream_json:
+            with open(output_file, 'w', encoding='utf-8') as f:
+                json.dump(
+                    result.data.to_dict(),
+                    f,
+                    ensure_ascii=config.ensure_ascii,
+                    indent=config.output_indent
+                )
+        else:
+            # 一次性编码后直接写入字节，绕过文本IO的逐块编码层
+            output_file.write_bytes(result_data.encode('utf-8'))
         print(f"结果已保存到文件: {output_file}")
     except Exception as e:
         print(f"保存文件失败: {e}")
-        print(result_data)  # 回退到控制台输出
+        # 回退到控制台输出
+        print(_dump_json(result.data, config) if stream_json else result_data)
 
 
 def main():
@@ -351,44 +454,58 @@ def main():
     args = parse_arguments()
     
     try:
+        # 仅导入配置与日志所需模块，试运行模式无需加载爬虫依赖
+        from src.config.config_manager import ConfigManager
+        
         # 初始化配置管理器
-        config_manager = ConfigManager()
+        config_manager = ConfigManager.instance()
         
         # 设置运行环境
         config, logger = setup_environment(config_manager, args)
         
         # 试运行模式检查
         if args.dry_run:
-            logger.info("=== 试运行模式 ===")
-            logger.info(f"📊 基本配置 - 最大项目数: {config.max_items}, 请求间隔: {config.request_interval}秒")
-            logger.info(f"🎯 爬虫设置 - 跳过置顶: {config.skip_top_item}, 输出格式: {args.format}")
-            logger.info(f"🖥️  浏览器配置 - 无头模式: {config.browser_headless}")
-            logger.info(f"📥 视频下载 - 启用: {config.video_download_enabled}, 目录: {config.video_download_dir}")
-            if args.output:
-                logger.info(f"📁 输出文件: {args.output}")
-            logger.info("✅ 试运行完成，退出程序")
+            # 日志级别高于INFO时跳过所有消息构建
+            if logger.isEnabledFor(logging.INFO):
+                max_items, request_interval = config.max_items, config.request_interval
+                skip_top_item, browser_headless = config.skip_top_item, config.browser_headless
+                download_enabled, download_dir = config.video_download_enabled, config.video_download_dir
+                output_format, output_file = args.format, args.output
+                
+                logger.info("=== 试运行模式 ===")
+                logger.info(f"📊 基本配置 - 最大项目数: {max_items}, 请求间隔: {request_interval}秒")
+                logger.info(f"🎯 爬虫设置 - 跳过置顶: {skip_top_item}, 输出格式: {output_format}")
+                logger.info(f"🖥️  浏览器配置 - 无头模式: {browser_headless}")
+                logger.info(f"📥 视频下载 - 启用: {download_enabled}, 目录: {download_dir}")
+                if output_file:
+                    logger.info(f"📁 输出文件: {output_file}")
+                logger.info("✅ 试运行完成，退出程序")
             return
         
+        # 非试运行模式才加载爬虫及性能监控相关模块
+        from src.utils.performance import PerformanceMonitor, CacheManager, RateLimiter
+        from src.spider.douyin_spider import DouyinSpider
+        
         # 开始执行爬虫
-        logger.info(f"🚀 开始爬取抖音热榜 (获取{config.max_items}条)")
+        logger.info("🚀 开始爬取抖音热榜 (获取%d条)", config.max_items)
         
-        # 创建性能监控器
-        perf_monitor = PerformanceMonitor()
+        # 创建性能监控器，系统资源采样仅在需要详细性能信息时启用
+        perf_monitor = PerformanceMonitor(monitor_system=args.performance)
         perf_monitor.start()
         
-        # 创建缓存管理器
+        # 创建缓存管理器（仅在启用缓存时创建，避免扫描缓存目录）
         cache_manager = CacheManager(
             max_size=100,
             ttl=config.cache_duration,
             enable_persistence=True,
             cache_dir="cache"
-        )
+        ) if config.enable_cache else None
         
-        # 创建速率限制器
+        # 创建速率限制器（仅在启用速率限制时创建）
         rate_limiter = RateLimiter(
             max_requests=config.rate_limit_requests,
             time_window=config.rate_limit_period
-        )
+        ) if config.enable_rate_limit else None
         
         # 创建爬虫实例
         spider = DouyinSpider(
@@ -413,35 +530,43 @@ def main():
         # 检查是否使用了缓存
         used_cache = stats['request_count'] == 0 and result.success
         
-        if args.performance:
-            # 详细性能统计
-            logger.info("📊 详细性能统计")
-            logger.info(f"⏱️  总时间: {stats['total_time']:.1f}秒")
-            if used_cache:
-                logger.info("💾 使用缓存数据 (无网络请求)")
-                logger.info(f"📈 缓存命中: 100.0% | ⚡ 响应时间: {stats['total_time']:.2f}秒")
-            else:
-                logger.info(f"📡 请求: {stats['request_count']}次 (成功{stats['success_count']}次, 失败{stats['error_count']}次)")
-                logger.info(f"📈 成功率: {stats['success_rate']:.1f}% | ⚡ 平均请求: {stats['avg_request_time']:.2f}秒")
-                logger.info(f"🚀 请求频率: {stats['requests_per_second']:.2f}次/秒")
-                logger.info(f"⚡ 请求详情: 最快{stats['min_request_time']:.2f}秒, 最慢{stats['max_request_time']:.2f}秒")
-            logger.info(f"💾 内存: {stats['memory_usage']:.1f}MB (峰值{stats['max_memory']:.1f}MB)")
-            logger.info(f"🖥️  CPU: {stats['cpu_usage']:.1f}% (峰值{stats['max_cpu']:.1f}%)")
-        else:
-            # 简要性能统计
-            if used_cache:
-                logger.info(f"📊 性能: {stats['total_time']:.1f}秒 | 💾 缓存命中 | 100.0%成功率")
+        # 统计信息仅在INFO级别可输出时才进行格式化
+        if logger.isEnabledFor(logging.INFO):
+            if args.performance:
+                # 详细性能统计，统计项一次性绑定为局部变量
+                (total_time, request_count, success_count, error_count, success_rate,
+                 avg_request_time, requests_per_second, min_request_time, max_request_time,
+                 memory_usage, max_memory, cpu_usage, max_cpu) = _PERF_STATS_GETTER(stats)
+                
+                logger.info("📊 详细性能统计")
+                logger.info(f"⏱️  总时间: {total_time:.1f}秒")
+                if used_cache:
+                    logger.info("💾 使用缓存数据 (无网络请求)")
+                    logger.info(f"📈 缓存命中: 100.0% | ⚡ 响应时间: {total_time:.2f}秒")
+                else:
+                    logger.info(f"📡 请求: {request_count}次 (成功{success_count}次, 失败{error_count}次)")
+                    logger.info(f"📈 成功率: {success_rate:.1f}% | ⚡ 平均请求: {avg_request_time:.2f}秒")
+                    logger.info(f"🚀 请求频率: {requests_per_second:.2f}次/秒")
+                    logger.info(f"⚡ 请求详情: 最快{min_request_time:.2f}秒, 最慢{max_request_time:.2f}秒")
+                logger.info(f"💾 内存: {memory_usage:.1f}MB (峰值{max_memory:.1f}MB)")
+                logger.info(f"🖥️  CPU: {cpu_usage:.1f}% (峰值{max_cpu:.1f}%)")
             else:
-                logger.info(f"📊 性能: {stats['total_time']:.1f}秒 | {stats['request_count']}次请求 | {stats['success_rate']:.1f}%成功率")
+                # 简要性能统计
+                if used_cache:
+                    logger.info(f"📊 性能: {stats['total_time']:.1f}秒 | 💾 缓存命中 | 100.0%成功率")
+                else:
+                    logger.info(f"📊 性能: {stats['total_time']:.1f}秒 | {stats['request_count']}次请求 | {stats['success_rate']:.1f}%成功率")
         
         # 输出爬取结果
         if result.success:
             items_failed = result.items_processed - result.items_success
-            success_rate = result.items_success / result.items_processed * 100 if result.items_processed > 0 else 0
-            logger.info(f"📋 结果: 处理{result.items_processed}条, 成功{result.items_success}条, 失败{items_failed}条 | {success_rate:.1f}%成功率")
+            logger.info(
+                "📋 结果: 处理%d条, 成功%d条, 失败%d条 | %.1f%%成功率",
+                result.items_processed, result.items_success, items_failed, result.success_rate
+            )
             output_result(result, args, config)
         else:
-            logger.error(f"❌ 爬取失败: {result.error_message}")
+            logger.error("❌ 爬取失败: %s", result.error_message)
             
     except KeyboardInterrupt:
         # 处理用户中断
@@ -15,15 +15,41 @@
     python manage_logs.py --view --recent 5          # 查看最近5个日志文件
 """
 
+import os
 import sys
+import heapq
 import argparse
-from pathlib import Path
+import time
+from itertools import islice
+from typing import List
+from concurrent.futures import ThreadPoolExecutor
 
 # 添加src目录到Python路径
-sys.path.insert(0, str(Path(__file__).parent / "src"))
+_SRC_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "src")
+if _SRC_DIR not in sys.path:
+    sys.path.insert(0, _SRC_DIR)
 
 from src.utils.log_cleaner import LogCleaner
 
+# 每MB字节数
+_MB = 1024 * 1024
+
+
+def _read_preview(path: str, line_count: int = 3) -> List[str]:
+    """
+    读取日志文件开头几行作为预览
+    
+    @param {str} path - 日志文件路径
+    @param {int} line_count - 读取行数
+    @returns {List[str]} 预览行列表，读取失败时返回错误信息
+    """
+    try:
+        with open(path, 'r', encoding='utf-8', errors='replace', buffering=8192) as f:
+            # 只读取前几行，不加载整个文件
+            return [line.rstrip() for line in islice(f, line_count)]
+    except Exception as e:
+        return [f"读取文件失败: {e}"]
+
 
 def view_recent_logs(log_dir: str = "logs", count: int = 10):
     """
@@ -33,34 +59,34 @@ def view_recent_logs(log_dir: str = "logs", count: int = 10):
     @param {int} count - 显示数量
     @returns {None}
     """
-    cleaner = LogCleaner(log_dir)
-    files = cleaner.get_log_files()
+    # LogCleaner 会确保日志目录存在
+    entries = LogCleaner(log_dir).scan_log_files()
     
-    # 按修改时间排序
-    files.sort(key=lambda f: f.stat().st_mtime, reverse=True)
+    # 只选出修改时间最新的 count 个文件，无需对全部文件排序
+    recent = heapq.nlargest(count, entries, key=lambda entry: entry[2].st_mtime)
     
-    print(f"📋 最近 {min(count, len(files))} 个日志文件:")
-    print("-" * 80)
+    # 预览读取以I/O等待为主，使用线程池并发读取，map 保持原有顺序
+    previews = []
+    if recent:
+        with ThreadPoolExecutor(max_workers=min(8, len(recent))) as executor:
+            previews = list(executor.map(_read_preview, [path for _, path, _ in recent]))
     
-    for i, file in enumerate(files[:count]):
-        stat = file.stat()
-        size_mb = stat.st_size / (1024 * 1024)
-        mtime = Path(file).stat().st_mtime
-        from datetime import datetime
-        mtime_str = datetime.fromtimestamp(mtime).strftime("%Y-%m-%d %H:%M:%S")
+    # 先拼接全部输出，最后一次性写入标准输出
+    out = [f"📋 最近 {len(recent)} 个日志文件:\n", "-" * 80, "\n"]
+    
+    for i, ((name, path, stat), preview) in enumerate(zip(recent, previews)):
+        size_mb = stat.st_size / _MB
+        mtime_str = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(stat.st_mtime))
         
-        print(f"{i+1:2d}. {file.name}")
-        print(f"    大小: {size_mb:.2f}MB | 修改时间: {mtime_str}")
+        out.append(f"{i+1:2d}. {name}\n")
+        out.append(f"    大小: {size_mb:.2f}MB | 修改时间: {mtime_str}\n")
         
         # 显示文件前几行内容
-        try:
-            with open(file, 'r', encoding='utf-8') as f:
-                lines = f.readlines()[:3]  # 只显示前3行
-                for line in lines:
-                    print(f"    {line.rstrip()}")
-        except Exception as e:
-            print(f"    读取文件失败: {e}")
-        print()
+        for line in preview:
+            out.append(f"    {line}\n")
+        out.append("\n")
+    
+    sys.stdout.write("".join(out))
 
 
 def main():
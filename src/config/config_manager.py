@@ -12,7 +12,7 @@
 - 环境变量配置覆盖
 - 配置参数验证
 - 动态配置更新
-- 配置热重载支持
+- 配置热重载支持（可选 watchdog 文件监听）
 
 配置层次:
 1. 默认配置 (硬编码)
@@ -21,8 +21,8 @@
 4. 命令行参数 (运行时)
 
 @example
-    # 创建配置管理器
-    config_manager = ConfigManager()
+    # 获取共享的配置管理器
+    config_manager = ConfigManager.instance()
     
     # 获取配置
     config = config_manager.get_config()
@@ -30,23 +30,90 @@
     # 更新配置
     config_manager.update_config(max_items=10, request_interval=2)
 """
-import json
 import os
-import importlib.util
+import re
+import ast
+import sys
+import json
+import time
+import functools
+import types
+import logging
+import threading
+import warnings
 from pathlib import Path
-from dataclasses import dataclass, field
-from typing import Optional, Dict, Any
 from datetime import datetime
+import dataclasses
+from dataclasses import dataclass, field
+from typing import AbstractSet, Optional, Dict, Any, Tuple, ClassVar, Callable, Type, FrozenSet
+from urllib.parse import urlparse
+from ..core.constants import get_error_message
 from ..core.exceptions import ConfigurationException, SecurityException, ValidationException
 
+# msgspec/orjson 为可选依赖，存在时用于加速配置文件解析（优先使用 msgspec）。
+# 解析结果会按文件指纹缓存并在多次加载间复用，因此需要完整的 dict，
+# 不使用 simdjson On-Demand 这类依赖解析器生命周期的惰性文档对象。
+try:
+    import msgspec
+    _json_loads = msgspec.json.decode
+    _JSON_DECODE_ERRORS: Tuple[Type[Exception], ...] = (msgspec.DecodeError, UnicodeDecodeError)
+except ImportError:
+    try:
+        import orjson
+        _json_loads = orjson.loads
+        _JSON_DECODE_ERRORS = (orjson.JSONDecodeError,)
+    except ImportError:
+        _json_loads = json.loads
+        _JSON_DECODE_ERRORS = (json.JSONDecodeError, UnicodeDecodeError)
+
+
+_logger = logging.getLogger(__name__)
+
+# 配置对象创建后不可变，更新时整体替换；Python 3.10+ 另外启用 slots，
+# 实例不再携带 __dict__，属性访问更快、占用更少内存
+_DATACLASS_OPTIONS: Dict[str, Any] = {"frozen": True}
+if sys.version_info >= (3, 10):
+    _DATACLASS_OPTIONS["slots"] = True
+
 
-@dataclass
+# 默认配置目录（项目根目录）
+_DEFAULT_CONFIG_DIR = Path(__file__).resolve().parents[2]
+
+# 可信域名白名单及其子域名后缀（str.endswith 支持元组，一次调用即可完成匹配）
+_TRUSTED_DOMAINS = ('douyin.com', 'snssdk.com', 'bytedance.com')
+_TRUSTED_SUFFIXES = tuple('.' + domain for domain in _TRUSTED_DOMAINS)
+
+# Cookie示例文本识别（一次扫描完成所有占位符匹配，无需生成小写副本）
+_COOKIE_PLACEHOLDER_RE = re.compile(r'请在此处|example|示例', re.IGNORECASE)
+
+# 环境配置项到 AppConfig 字段的映射 (环境变量名, 配置字段名)
+_ENV_CONFIG_FIELDS = (
+    ('DOUYIN_COOKIE', 'cookie'),
+    ('MAX_ITEMS', 'max_items'),
+    ('REQUEST_INTERVAL', 'request_interval'),
+    ('BROWSER_HEADLESS', 'browser_headless'),
+    ('VIDEO_DOWNLOAD_ENABLED', 'video_download_enabled'),
+    ('VIDEO_DOWNLOAD_DIR', 'video_download_dir'),
+    ('ENABLE_PROXY', 'enable_proxy'),
+    ('PROXY_CONFIG', 'proxy_config'),
+    ('ENABLE_RATE_LIMIT', 'enable_rate_limit'),
+    ('RATE_LIMIT_REQUESTS', 'rate_limit_requests'),
+    ('RATE_LIMIT_PERIOD', 'rate_limit_period'),
+    ('ENABLE_RETRY_BACKOFF', 'enable_retry_backoff'),
+    ('MAX_CONCURRENT_WORKERS', 'max_concurrent_workers'),
+    ('DEBUG', 'debug'),
+)
+
+
+@dataclass(**_DATACLASS_OPTIONS)
 class AppConfig:
     """
     应用配置数据类
     
     使用dataclass装饰器自动生成初始化方法、字符串表示等。
     包含抖音爬虫运行所需的所有配置参数。
+    配置对象不可变，更新配置时通过 dataclasses.replace 生成新对象；
+    在 Python 3.10 及以上版本中以 __slots__ 方式存储字段。
     
     @author: MingTechPro
     @version: 1.0.0
@@ -114,6 +181,8 @@ class AppConfig:
     log_backup_count: int      # 日志文件备份数量
     log_format: str            # 日志格式
     log_date_format: str       # 日志日期格式
+    cleanup_old_logs: bool = True  # 是否自动清理旧日志
+    log_retention_days: int = 7    # 日志保留天数
     
     # URL编码配置组 - URL编码相关设置
     url_encoding_enabled: bool = True              # 是否启用URL编码
@@ -125,6 +194,8 @@ class AppConfig:
     browser_headless: bool = False         # 是否启用无头模式（后台运行）
     browser_disable_dev_shm_usage: bool = True   # 是否禁用/dev/shm使用
     browser_no_sandbox: bool = False       # 是否禁用沙盒模式
+    browser_pool_size: int = 0             # 浏览器池保留的空闲实例数（0表示不复用，用完即关闭）
+    browser_recycle_after: int = 100       # 池中单个浏览器实例最多被取出的次数，达到后关闭重建
     
     # 视频下载配置组 - 视频下载功能选项
     video_download_enabled: bool = False           # 是否启用视频下载功能
@@ -147,13 +218,107 @@ class AppConfig:
     max_concurrent_workers: int = 3                # 最大并发工作线程数
     debug: bool = False                            # 是否启用调试模式
     
-    def validate(self) -> None:
+    # 派生缓存 - URL解析结果 (URL -> 小写域名)，不参与初始化、比较和字符串表示
+    _url_domains: Dict[str, str] = field(default_factory=dict, init=False, repr=False, compare=False)
+    
+    # 取值范围很小的字符串字段，加载后驻留（sys.intern）以共享同一对象
+    _INTERNED_FIELDS: ClassVar[Tuple[str, ...]] = (
+        "output_format", "log_level", "console_log_level", "file_log_level",
+        "url_encoding_method", "url_encoding_encoding",
+    )
+    
+    # 需要校验的URL字段 (字段名, 显示名称)
+    _URL_FIELDS: ClassVar[Tuple[Tuple[str, str], ...]] = (
+        ("hot_list_url", "热榜URL"),
+        ("video_url", "视频URL"),
+    )
+    
+    # 数值范围校验表 (字段名, 校验函数, 异常类型, 错误消息, 修复建议)，按顺序依次检查
+    _RANGE_CHECKS: ClassVar[Tuple[Tuple[str, Callable[[Any], bool], Type[Exception], str, str], ...]] = (
+        # 请求配置
+        ("hot_list_timeout", lambda v: v is not None and v > 0, ValidationException,
+         "热榜请求超时时间必须大于0", "设置合理的超时时间（建议10-60秒）"),
+        ("video_detail_timeout", lambda v: v is not None and v > 0, ValidationException,
+         "视频详情请求超时时间必须大于0", "设置合理的超时时间（建议5-30秒）"),
+        
+        # 重试配置
+        ("hot_list_max_retries", lambda v: v is not None and v >= 0, ValidationException,
+         "热榜请求重试次数不能为负数", "设置合理的重试次数（建议0-5次）"),
+        ("video_detail_max_retries", lambda v: v is not None and v >= 0, ValidationException,
+         "视频详情重试次数不能为负数", "设置合理的重试次数（建议0-3次）"),
+        ("hot_list_delay", lambda v: v is not None and v >= 0, ValidationException,
+         "热榜请求重试延迟不能为负数", "设置合理的延迟时间（建议1-10秒）"),
+        ("video_detail_delay", lambda v: v is not None and v >= 0, ValidationException,
+         "视频详情重试延迟不能为负数", "设置合理的延迟时间（建议1-5秒）"),
+        
+        # 爬虫配置
+        ("max_items", lambda v: v is not None and v > 0, ValidationException,
+         "最大项目数必须大于0", "设置合理的项目数（建议1-100）"),
+        ("max_items", lambda v: v <= 1000, ValidationException,
+         "最大项目数不能超过1000", "降低最大项目数以避免被限流"),
+        ("request_interval", lambda v: v is not None and v >= 0, ValidationException,
+         "请求间隔不能为负数", "设置合理的请求间隔（建议1-5秒）"),
+        # 安全检查：请求间隔过短
+        ("request_interval", lambda v: v >= 0.5, SecurityException,
+         "请求间隔过短，可能被反爬虫机制检测", "增加请求间隔到至少0.5秒"),
+        
+        # 输出配置
+        ("output_indent", lambda v: v is not None and v >= 0, ValidationException,
+         "输出缩进不能为负数", "设置合理的缩进值（建议0-8）"),
+        
+        # 高级配置
+        ("rate_limit_requests", lambda v: v is not None and v > 0, ValidationException,
+         "限流请求数必须大于0", "设置合理的限流请求数（建议5-50）"),
+        ("rate_limit_period", lambda v: v is not None and v > 0, ValidationException,
+         "限流时间窗口必须大于0", "设置合理的时间窗口（建议10-300秒）"),
+        ("max_concurrent_workers", lambda v: v is not None and v > 0, ValidationException,
+         "并发工作线程数必须大于0", "设置合理的线程数（建议1-10）"),
+        ("max_concurrent_workers", lambda v: v <= 20, SecurityException,
+         "并发线程数过多，可能被反爬虫机制检测", "减少并发线程数到20以下"),
+        ("browser_pool_size", lambda v: v is not None and v >= 0, ValidationException,
+         "浏览器池大小不能为负数", "设置为0（不复用）或较小的正数（建议1-4）"),
+        ("browser_recycle_after", lambda v: v is not None and v > 0, ValidationException,
+         "浏览器复用次数上限必须大于0", "设置合理的复用次数（建议50-200）"),
+    )
+    
+    # validate() 会检查的全部字段，局部验证时与变更字段无交集则直接跳过
+    _VALIDATED_FIELDS: ClassVar[FrozenSet[str]] = frozenset(
+        [attr for attr, _ in _URL_FIELDS] + [check[0] for check in _RANGE_CHECKS] + ["user_agent", "cookie"]
+    )
+    
+    def __post_init__(self) -> None:
+        """创建实例后驻留枚举型字符串，并预先解析URL域名供后续 validate() 复用"""
+        for attr in self._INTERNED_FIELDS:
+            value = getattr(self, attr)
+            if type(value) is str:
+                object.__setattr__(self, attr, sys.intern(value))
+        self._refresh_url_cache()
+    
+    def _refresh_url_cache(self) -> None:
+        """
+        重新解析热榜和视频URL的域名
+        
+        解析失败的URL不写入缓存，由 validate() 负责报告格式错误。
+        
+        @returns {None}
+        """
+        url_domains = {}
+        for url in (self.hot_list_url, self.video_url):
+            try:
+                url_domains[url] = urlparse(url).netloc.lower()
+            except (ValueError, TypeError, AttributeError):
+                continue
+        object.__setattr__(self, "_url_domains", url_domains)
+    
+    def validate(self, fields: Optional[AbstractSet[str]] = None) -> None:
         """
         验证配置参数的有效性
         
         检查所有配置参数是否符合业务逻辑要求，确保配置的正确性。
         现在使用自定义异常类提供更精确的错误信息。
         
+        @param {Optional[AbstractSet[str]]} fields - 只验证这些字段；为None时验证全部字段。
+                                                  用于在已验证的配置上局部更新后只检查变化的字段
         @returns {None}
         @throws {ConfigurationException} 当配置参数无效时抛出
         @throws {SecurityException} 当安全配置有问题时抛出
@@ -169,156 +334,50 @@ class AppConfig:
             except SecurityException as e:
                 print(f"安全问题: {e}")
         """
-        # 验证URL配置
-        if not self.hot_list_url or not self.hot_list_url.startswith('http'):
-            raise ConfigurationException(
-                "热榜URL不能为空且必须是有效的HTTP(S)地址",
-                context={"hot_list_url": self.hot_list_url},
-                suggestion="检查配置文件中的URLs设置"
-            )
+        if fields is not None and fields.isdisjoint(self._VALIDATED_FIELDS):
+            return
         
-        if not self.video_url or not self.video_url.startswith('http'):
-            raise ConfigurationException(
-                "视频URL不能为空且必须是有效的HTTP(S)地址",
-                context={"video_url": self.video_url},
-                suggestion="检查配置文件中的URLs设置"
-            )
-        
-        # 验证URL域名安全性
-        self._validate_url_security(self.hot_list_url, "热榜URL")
-        self._validate_url_security(self.video_url, "视频URL")
-            
-        # 验证请求配置
-        if not self.user_agent:
-            raise ConfigurationException(
-                "User-Agent不能为空",
-                context={"user_agent": self.user_agent},
-                suggestion="在配置文件中设置有效的User-Agent"
-            )
-        
-        # 验证User-Agent安全性
-        if len(self.user_agent) < 10:
-            raise SecurityException(
-                "User-Agent过短，可能被识别为爬虫",
-                context={"user_agent_length": len(self.user_agent)},
-                suggestion="使用更真实的浏览器User-Agent"
-            )
-            
-        if self.hot_list_timeout is None or self.hot_list_timeout <= 0:
-            raise ValidationException(
-                "热榜请求超时时间必须大于0",
-                context={"hot_list_timeout": self.hot_list_timeout},
-                suggestion="设置合理的超时时间（建议10-60秒）"
-            )
-        
-        if self.video_detail_timeout is None or self.video_detail_timeout <= 0:
-            raise ValidationException(
-                "视频详情请求超时时间必须大于0",
-                context={"video_detail_timeout": self.video_detail_timeout},
-                suggestion="设置合理的超时时间（建议5-30秒）"
-            )
-            
-        # 验证重试配置
-        if self.hot_list_max_retries is None or self.hot_list_max_retries < 0:
-            raise ValidationException(
-                "热榜请求重试次数不能为负数",
-                context={"hot_list_max_retries": self.hot_list_max_retries},
-                suggestion="设置合理的重试次数（建议0-5次）"
-            )
-        
-        if self.video_detail_max_retries is None or self.video_detail_max_retries < 0:
-            raise ValidationException(
-                "视频详情重试次数不能为负数",
-                context={"video_detail_max_retries": self.video_detail_max_retries},
-                suggestion="设置合理的重试次数（建议0-3次）"
-            )
-            
-        if self.hot_list_delay is None or self.hot_list_delay < 0:
-            raise ValidationException(
-                "热榜请求重试延迟不能为负数",
-                context={"hot_list_delay": self.hot_list_delay},
-                suggestion="设置合理的延迟时间（建议1-10秒）"
-            )
-        
-        if self.video_detail_delay is None or self.video_detail_delay < 0:
-            raise ValidationException(
-                "视频详情重试延迟不能为负数",
-                context={"video_detail_delay": self.video_detail_delay},
-                suggestion="设置合理的延迟时间（建议1-5秒）"
-            )
-            
-        # 验证爬虫配置
-        if self.max_items is None or self.max_items <= 0:
-            raise ValidationException(
-                "最大项目数必须大于0",
-                context={"max_items": self.max_items},
-                suggestion="设置合理的项目数（建议1-100）"
-            )
-        
-        if self.max_items > 1000:
-            raise ValidationException(
-                "最大项目数不能超过1000",
-                context={"max_items": self.max_items},
-                suggestion="降低最大项目数以避免被限流"
-            )
-            
-        if self.request_interval is None or self.request_interval < 0:
-            raise ValidationException(
-                "请求间隔不能为负数",
-                context={"request_interval": self.request_interval},
-                suggestion="设置合理的请求间隔（建议1-5秒）"
-            )
+        # 验证URL配置及域名安全性
+        for attr, url_name in self._URL_FIELDS:
+            if fields is not None and attr not in fields:
+                continue
+            url = getattr(self, attr)
+            if not url or not url.startswith('http'):
+                raise ConfigurationException(
+                    f"{url_name}不能为空且必须是有效的HTTP(S)地址",
+                    context={attr: url},
+                    suggestion="检查配置文件中的URLs设置"
+                )
+            self._validate_url_security(url, url_name)
         
-        # 安全检查：请求间隔过短警告
-        if self.request_interval < 0.5:
-            raise SecurityException(
-                "请求间隔过短，可能被反爬虫机制检测",
-                context={"request_interval": self.request_interval},
-                suggestion="增加请求间隔到至少0.5秒"
-            )
-            
-        # 验证输出配置
-        if self.output_indent is None or self.output_indent < 0:
-            raise ValidationException(
-                "输出缩进不能为负数",
-                context={"output_indent": self.output_indent},
-                suggestion="设置合理的缩进值（建议0-8）"
-            )
+        if fields is None or "user_agent" in fields:
+            # 验证请求配置
+            if not self.user_agent:
+                raise ConfigurationException(
+                    "User-Agent不能为空",
+                    context={"user_agent": self.user_agent},
+                    suggestion="在配置文件中设置有效的User-Agent"
+                )
             
-        # 验证高级配置
-        if self.rate_limit_requests is None or self.rate_limit_requests <= 0:
-            raise ValidationException(
-                "限流请求数必须大于0",
-                context={"rate_limit_requests": self.rate_limit_requests},
-                suggestion="设置合理的限流请求数（建议5-50）"
-            )
-        
-        if self.rate_limit_period is None or self.rate_limit_period <= 0:
-            raise ValidationException(
-                "限流时间窗口必须大于0",
-                context={"rate_limit_period": self.rate_limit_period},
-                suggestion="设置合理的时间窗口（建议10-300秒）"
-            )
+            # 验证User-Agent安全性
+            if len(self.user_agent) < 10:
+                raise SecurityException(
+                    "User-Agent过短，可能被识别为爬虫",
+                    context={"user_agent_length": len(self.user_agent)},
+                    suggestion="使用更真实的浏览器User-Agent"
+                )
             
-        if self.max_concurrent_workers is None or self.max_concurrent_workers <= 0:
-            raise ValidationException(
-                "并发工作线程数必须大于0",
-                context={"max_concurrent_workers": self.max_concurrent_workers},
-                suggestion="设置合理的线程数（建议1-10）"
-            )
-        
-        if self.max_concurrent_workers > 20:
-            raise SecurityException(
-                "并发线程数过多，可能被反爬虫机制检测",
-                context={"max_concurrent_workers": self.max_concurrent_workers},
-                suggestion="减少并发线程数到20以下"
-            )
+        # 按表逐项校验数值范围
+        for attr, is_valid, exc_class, message, suggestion in self._RANGE_CHECKS:
+            if fields is not None and attr not in fields:
+                continue
+            value = getattr(self, attr)
+            if not is_valid(value):
+                raise exc_class(message, context={attr: value}, suggestion=suggestion)
         
         # 验证Cookie安全性（仅在提供真实Cookie时验证，跳过示例文本）
-        if (self.cookie and len(self.cookie.strip()) > 0 and 
-            not self.cookie.startswith('请在此处') and
-            not 'example' in self.cookie.lower() and
-            not '示例' in self.cookie):
+        if ((fields is None or "cookie" in fields) and self.cookie and not self.cookie.isspace()
+                and not _COOKIE_PLACEHOLDER_RE.search(self.cookie)):
             self._validate_cookie_security()
     
     def _validate_url_security(self, url: str, url_name: str) -> None:
@@ -329,25 +388,18 @@ class AppConfig:
         @param {str} url_name - URL名称（用于错误消息）
         @raises {SecurityException} 当URL不安全时抛出
         """
-        from urllib.parse import urlparse
-        
         try:
-            parsed = urlparse(url)
-            domain = parsed.netloc.lower()
+            domain = self._url_domains.get(url)
+            if domain is None:
+                domain = urlparse(url).netloc.lower()
             
             # 检查是否是可信域名
-            trusted_domains = ['douyin.com', 'snssdk.com', 'bytedance.com']
-            is_trusted = False
-            
-            for trusted_domain in trusted_domains:
-                if domain == trusted_domain or domain.endswith('.' + trusted_domain):
-                    is_trusted = True
-                    break
+            is_trusted = domain in _TRUSTED_DOMAINS or domain.endswith(_TRUSTED_SUFFIXES)
             
             if not is_trusted:
                 raise SecurityException(
                     f"{url_name}域名不在可信列表中",
-                    context={"url": url, "domain": domain, "trusted_domains": trusted_domains},
+                    context={"url": url, "domain": domain, "trusted_domains": _TRUSTED_DOMAINS},
                     suggestion="确认URL是否为官方抖音域名"
                 )
                 
@@ -382,7 +434,6 @@ class AppConfig:
             
             # 检查警告
             if result['warning']:
-                import warnings
                 for warning in result['warning']:
                     warnings.warn(f"Cookie安全警告: {warning}", UserWarning)
                             
@@ -396,6 +447,260 @@ class AppConfig:
                 )
 
 
+# AppConfig 初始化参数 (字段名, 默认值, 默认值工厂)，按声明顺序排列，用于位置参数构造
+_APP_CONFIG_INIT_FIELDS = tuple(
+    (f.name, f.default, None if f.default_factory is dataclasses.MISSING else f.default_factory)
+    for f in dataclasses.fields(AppConfig) if f.init
+)
+
+# 可通过 update_config 更新的配置项
+_APP_CONFIG_FIELDS = frozenset(name for name, _, _ in _APP_CONFIG_INIT_FIELDS)
+
+
+@functools.lru_cache(maxsize=8)
+def _render_output_filename(template: str, epoch_second: int) -> str:
+    """按秒缓存的文件名渲染，同一秒内重复输出直接复用结果"""
+    # 只替换 {timestamp} 占位符，模板中的其他花括号原样保留
+    return template.replace("{timestamp}", time.strftime("%Y%m%d_%H%M%S", time.localtime(epoch_second)))
+
+
+def render_output_filename(template: str, now: Optional[datetime] = None) -> str:
+    """
+    渲染输出文件名模板
+    
+    以秒为粒度替换模板中的 {timestamp}（格式 YYYYmmdd_HHMMSS），其他内容（包括花括号）
+    原样保留；同一秒内多次调用只格式化一次。
+    
+    @param {str} template - 文件名模板，如 "douyin_hotlist_{timestamp}"
+    @param {Optional[datetime]} now - 时间点，为None时使用当前时间
+    @returns {str} 不含扩展名的文件名
+    
+    @example
+        render_output_filename("douyin_hotlist_{timestamp}")  # 'douyin_hotlist_20250815_120000'
+    """
+    epoch_second = int(now.timestamp() if now is not None else time.time())
+    return _render_output_filename(template, epoch_second)
+
+
+def _build_app_config(config_data: Dict[str, Any], env_config: Dict[str, Any]) -> AppConfig:
+    """
+    由配置文件数据和环境配置构建配置对象
+    
+    字段映射写成直线代码，在模块导入时一次编译完成，每次加载配置只需执行字典取值。
+    
+    @param {Dict[str, Any]} config_data - config.json 解析结果
+    @param {Dict[str, Any]} env_config - 环境配置项
+    @returns {AppConfig} 配置对象（尚未验证）
+    """
+    urls = config_data["urls"]
+    request = config_data["request"]
+    retry = request["retry"]
+    crawler = config_data["crawler"]
+    browser = config_data.get("browser", {})
+    video_download = config_data.get("video_download", {})
+    output = config_data["output"]
+    logging_config = config_data["logging"]
+    url_encoding = config_data.get("url_encoding", {})
+    
+    # 先将嵌套的配置文件展平为字段字典
+    flat = {
+        # URLs配置
+        "hot_list_url": urls["hot_list"],
+        "video_url": urls["video"],
+        
+        # 请求配置
+        "user_agent": request["headers"]["User-Agent"],
+        "cookie": "",
+        "hot_list_timeout": request["timeouts"]["hot_list"],
+        "video_detail_timeout": request["timeouts"]["video_detail"],
+        
+        # 重试配置
+        "hot_list_max_retries": retry["hot_list_max_retries"],
+        "hot_list_delay": retry["hot_list_delay"],
+        "video_detail_max_retries": retry["video_detail_max_retries"],
+        "video_detail_delay": retry["video_detail_delay"],
+        
+        # 爬虫配置
+        "max_items": crawler["max_items"],
+        "request_interval": crawler["request_interval"],
+        "skip_top_item": crawler["skip_top_item"],
+        "enable_cache": crawler["enable_cache"],
+        "cache_duration": crawler["cache_duration"],
+        "concurrent_requests": crawler["concurrent_requests"],
+        
+        # 浏览器配置
+        "browser_headless": browser.get("headless", False),
+        "browser_disable_dev_shm_usage": browser.get("disable_dev_shm_usage", True),
+        "browser_no_sandbox": browser.get("no_sandbox", False),
+        "browser_pool_size": browser.get("pool_size", 0),
+        "browser_recycle_after": browser.get("recycle_after", 100),
+        
+        # 视频下载配置
+        "video_download_enabled": video_download.get("enabled", False),
+        "video_download_dir": video_download.get("download_dir", "downloads"),
+        "video_download_max_file_size": video_download.get("max_file_size", 209715200),
+        "video_download_max_concurrent": video_download.get("max_concurrent", 3),
+        "video_download_timeout": video_download.get("timeout", 30),
+        "video_download_chunk_size": video_download.get("chunk_size", 8192),
+        "video_download_max_retries": video_download.get("max_retries", 3),
+        "video_download_retry_delay": video_download.get("retry_delay", 1.0),
+        "video_download_auto_download": video_download.get("auto_download", False),
+        
+        # 输出配置
+        "output_format": output["format"],
+        "output_indent": output["indent"],
+        "ensure_ascii": output["ensure_ascii"],
+        "output_default_path": output.get("default_path", "data"),
+        "output_filename_template": output.get("filename_template", "douyin_hotlist_{timestamp}"),
+        
+        # 日志配置
+        "log_level": logging_config["level"],
+        "console_log_level": logging_config["console_level"],
+        "file_log_level": logging_config["file_level"],
+        "log_file_path": logging_config["log_file"],
+        "log_max_file_size": logging_config["max_file_size"],
+        "log_backup_count": logging_config["backup_count"],
+        "log_format": logging_config["format"],
+        "log_date_format": logging_config["date_format"],
+        "cleanup_old_logs": logging_config.get("cleanup_old_logs", True),
+        "log_retention_days": logging_config.get("log_retention_days", 7),
+        
+        # URL编码配置
+        "url_encoding_enabled": url_encoding.get("enabled", True),
+        "url_encoding_method": url_encoding.get("method", "url_encode"),
+        "url_encoding_encoding": url_encoding.get("encoding", "utf-8"),
+        "url_encoding_safe_chars": url_encoding.get("safe_chars", ""),
+    }
+    
+    # 环境配置优先：一次性合并所有已设置的环境配置项（值为None表示使用配置文件的值）
+    flat.update({
+        field_name: value
+        for env_name, field_name in _ENV_CONFIG_FIELDS
+        if (value := env_config.get(env_name)) is not None
+    })
+    flat["cookie"] = flat["cookie"].strip()
+    
+    # 按字段声明顺序以位置参数构造，省去关键字参数的逐个匹配；未提供的字段使用默认值
+    return AppConfig(*[
+        flat[name] if name in flat else (factory() if factory is not None else default)
+        for name, default, factory in _APP_CONFIG_INIT_FIELDS
+    ])
+
+
+def _read_file_bytes(path: Path, size_hint: int) -> bytes:
+    """
+    以无缓冲的底层文件描述符读取整个文件
+    
+    大小已由调用方的 stat 得到，通常一次 os.read 即可读完；
+    文件在 stat 之后被追加写入时继续读到末尾。
+    
+    @param {Path} path - 文件路径
+    @param {int} size_hint - 预期文件大小(字节)
+    @returns {bytes} 文件内容
+    """
+    fd = os.open(path, os.O_RDONLY | getattr(os, "O_BINARY", 0))
+    try:
+        data = os.read(fd, size_hint + 1)
+        if len(data) <= size_hint:
+            return data
+        chunks = [data]
+        while True:
+            chunk = os.read(fd, 65536)
+            if not chunk:
+                return b"".join(chunks)
+            chunks.append(chunk)
+    finally:
+        os.close(fd)
+
+
+@functools.lru_cache(maxsize=8)
+def _compile_env_source(source: bytes, filename: str) -> types.CodeType:
+    """
+    编译环境配置文件源码，按内容缓存代码对象
+    
+    @param {bytes} source - 文件内容
+    @param {str} filename - 文件名，用于错误信息中的定位
+    @returns {CodeType} 编译后的代码对象
+    @throws {SyntaxError} 当源码存在语法错误时抛出
+    """
+    return compile(source, filename, 'exec')
+
+
+def _exec_env_file(source: bytes, path: Path) -> Dict[str, Any]:
+    """
+    执行环境配置文件并收集配置项
+    
+    仅在文件包含非字面量赋值（如 os.getenv(...)）时使用。直接在新的
+    命名空间中执行缓存的代码对象，不经过 importlib 的查找和模块创建流程。
+    
+    @param {bytes} source - 文件内容
+    @param {Path} path - 文件路径
+    @returns {Dict[str, Any]} 所有非私有、不可调用的顶层变量
+    @throws {ImportError} 当执行文件失败时抛出
+    """
+    code = _compile_env_source(source, str(path))
+    namespace: Dict[str, Any] = {'__name__': 'env_config', '__file__': str(path)}
+    try:
+        exec(code, namespace)
+    except Exception as e:
+        # 文件中的代码可能抛出任意异常，统一转换为导入失败
+        raise ImportError(f"执行环境配置文件失败: {e}") from e
+    
+    return {
+        name: value for name, value in namespace.items()
+        if not name.startswith('_') and not callable(value)
+    }
+
+
+def _parse_env_file(source: bytes, path: Path) -> Dict[str, Any]:
+    """
+    解析环境配置文件
+    
+    文件只由文档字符串、导入语句和形如 NAME = 字面量 的顶层赋值组成时，
+    以语法树方式读取，不执行文件中的代码；以下划线开头的名称会被跳过。
+    其他任何语句（条件、循环、带注解或增量赋值、解包赋值等）或非字面量的值
+    都可能改变执行结果，此时回退为执行整个文件。
+    
+    @param {bytes} source - 文件内容
+    @param {Path} path - 文件路径
+    @returns {Dict[str, Any]} 配置项字典
+    @throws {SyntaxError} 当文件存在语法错误时抛出
+    """
+    env_config = {}
+    imported_names = set()
+    for index, node in enumerate(ast.parse(source, filename=str(path)).body):
+        if isinstance(node, (ast.Import, ast.ImportFrom)):
+            for alias in node.names:
+                if alias.name == '*':
+                    return _exec_env_file(source, path)
+                imported_names.add((alias.asname or alias.name).split('.')[0])
+            continue
+        
+        if (index == 0 and isinstance(node, ast.Expr) and isinstance(node.value, ast.Constant)
+                and isinstance(node.value.value, str)):
+            continue
+        
+        if not (isinstance(node, ast.Assign) and len(node.targets) == 1
+                and isinstance(node.targets[0], ast.Name)):
+            _logger.debug("环境配置文件包含字面量赋值以外的语句，回退为执行配置文件")
+            return _exec_env_file(source, path)
+        
+        attr_name = node.targets[0].id
+        try:
+            value = ast.literal_eval(node.value)
+        except (ValueError, TypeError, SyntaxError, MemoryError, RecursionError):
+            _logger.debug("环境配置项 %s 不是字面量，回退为执行配置文件", attr_name)
+            return _exec_env_file(source, path)
+        
+        if not attr_name.startswith('_'):
+            env_config[attr_name] = value
+    
+    # 导入的名称与配置项同名时结果取决于语句顺序，交给执行路径处理
+    if not imported_names.isdisjoint(env_config):
+        return _exec_env_file(source, path)
+    return env_config
+
+
 class ConfigManager:
     """
     配置管理器
@@ -421,8 +726,8 @@ class ConfigManager:
     4. 命令行参数 (运行时)
     
     @example
-        # 创建配置管理器
-        config_manager = ConfigManager()
+        # 获取共享的配置管理器
+        config_manager = ConfigManager.instance()
         
         # 获取配置
         config = config_manager.get_config()
@@ -431,11 +736,59 @@ class ConfigManager:
         config_manager.update_config(max_items=10, request_interval=2)
     """
     
+    # 每个配置目录对应唯一实例
+    _instances: ClassVar[Dict[Path, "ConfigManager"]] = {}
+    
+    def __new__(cls, config_dir: Optional[str] = None):
+        """
+        获取配置目录对应的配置管理器实例
+        
+        同一配置目录只会创建一个实例，多处实例化时共享已加载的配置，
+        避免重复读取和解析配置文件。
+        
+        @param {Optional[str]} config_dir - 配置文件目录路径
+        @returns {ConfigManager} 配置管理器实例
+        """
+        key = cls._resolve_config_dir(config_dir)
+        instance = cls._instances.get(key)
+        if instance is None:
+            instance = super().__new__(cls)
+            instance._initialized = False
+            # setdefault 是原子操作，并发创建时所有调用方都会拿到同一个实例
+            instance = cls._instances.setdefault(key, instance)
+        return instance
+    
+    @classmethod
+    def instance(cls, config_dir: Optional[str] = None) -> "ConfigManager":
+        """
+        获取配置目录对应的共享配置管理器
+        
+        推荐的获取方式，多处调用共享同一实例及其已加载的配置。
+        
+        @param {Optional[str]} config_dir - 配置文件目录路径，为None时使用项目根目录
+        @returns {ConfigManager} 配置管理器实例
+        
+        @example
+            config = ConfigManager.instance().get_config()
+        """
+        return cls(config_dir)
+    
+    @staticmethod
+    def _resolve_config_dir(config_dir: Optional[str]) -> Path:
+        """
+        解析配置目录的绝对路径
+        
+        @param {Optional[str]} config_dir - 配置文件目录路径，为None时使用项目根目录
+        @returns {Path} 配置目录绝对路径
+        """
+        return Path(config_dir).resolve() if config_dir else _DEFAULT_CONFIG_DIR
+    
     def __init__(self, config_dir: Optional[str] = None):
         """
         初始化配置管理器
         
         创建配置管理器实例，设置配置文件目录路径。
+        同一配置目录重复实例化时直接返回已初始化的实例。
         
         @param {Optional[str]} config_dir - 配置文件目录路径，如果为None则使用默认路径
         @returns {None}
@@ -447,10 +800,50 @@ class ConfigManager:
             # 指定配置目录
             config_manager = ConfigManager("/path/to/config")
         """
-        self.config_dir = Path(config_dir) if config_dir else Path(__file__).parent.parent.parent
+        if self._initialized:
+            return
+        
+        self.config_dir = self._resolve_config_dir(config_dir)
+        self._config_file = self.config_dir / "config.json"
+        self._env_file = self.config_dir / "environment.py"
         self._config: Optional[AppConfig] = None
         self._env_config: Dict[str, Any] = {}
+        self._file_cache: Dict[str, Tuple[int, int, Dict[str, Any]]] = {}
+        self._env_error: Optional[str] = None
+        # 通过 update_config 应用的覆盖项（如命令行参数），重新加载配置文件后会再次应用
+        self._overrides: Dict[str, Any] = {}
+        # 保护配置的构建与替换；读取已发布的配置无需加锁
+        self._config_lock = threading.RLock()
+        self._observer = None
+        self._reload_timer: Optional[threading.Timer] = None
+        self._watch_lock = threading.Lock()
+        self._initialized = True
+        
+    def _read_cached(self, path: Path, parse: Callable[[bytes, Path], Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        读取并解析文件，按文件指纹缓存解析结果
+        
+        以 (路径, 修改时间, 文件大小) 作为指纹，文件未发生变化时
+        重新加载配置只需一次 stat，不再重复读取和解析；同一次 stat
+        同时完成存在性检查，并为读取提供文件大小。
         
+        @param {Path} path - 文件路径
+        @param {Callable[[bytes, Path], Dict[str, Any]]} parse - 解析函数
+        @returns {Dict[str, Any]} 解析后的数据
+        
+        @throws {FileNotFoundError} 当文件不存在时抛出
+        """
+        stat = path.stat()
+        
+        key = str(path)
+        cached = self._file_cache.get(key)
+        if cached is not None and cached[0] == stat.st_mtime_ns and cached[1] == stat.st_size:
+            return cached[2]
+        
+        data = parse(_read_file_bytes(path, stat.st_size), path)
+        self._file_cache[key] = (stat.st_mtime_ns, stat.st_size, data)
+        return data
+    
     def load_config(self) -> AppConfig:
         """
         加载配置文件
@@ -461,8 +854,10 @@ class ConfigManager:
         @returns {AppConfig} 配置对象，包含所有配置参数
         
         @throws {FileNotFoundError} 当配置文件不存在时抛出
-        @throws {RuntimeError} 当配置加载失败时抛出
-        @throws {ValueError} 当配置验证失败时抛出
+        @throws {RuntimeError} 当配置文件格式错误或缺少配置项时抛出
+        @throws {ConfigurationException} 当配置参数无效时抛出
+        @throws {SecurityException} 当安全配置有问题时抛出
+        @throws {ValidationException} 当参数验证失败时抛出
         
         @example
             config_manager = ConfigManager()
@@ -471,108 +866,51 @@ class ConfigManager:
         """
         if self._config is not None:
             return self._config
-            
-        try:
-            # 加载基础配置文件
-            config_file = self.config_dir / "config.json"
-            if not config_file.exists():
-                raise FileNotFoundError(f"配置文件不存在: {config_file}")
-            
-            with open(config_file, 'r', encoding='utf-8') as f:
-                config_data = json.load(f)
-            
-            # 加载环境配置
-            self._load_env_config()
-            
-            # 创建配置对象，环境配置优先
-            self._config = AppConfig(
-                # URLs配置
-                hot_list_url=config_data["urls"]["hot_list"],
-                video_url=config_data["urls"]["video"],
-                
-                # 请求配置
-                user_agent=config_data["request"]["headers"]["User-Agent"],
-                cookie=self._env_config.get('DOUYIN_COOKIE', '').strip(),
-                hot_list_timeout=config_data["request"]["timeouts"]["hot_list"],
-                video_detail_timeout=config_data["request"]["timeouts"]["video_detail"],
-                
-                # 重试配置
-                hot_list_max_retries=config_data["request"]["retry"]["hot_list_max_retries"],
-                hot_list_delay=config_data["request"]["retry"]["hot_list_delay"],
-                video_detail_max_retries=config_data["request"]["retry"]["video_detail_max_retries"],
-                video_detail_delay=config_data["request"]["retry"]["video_detail_delay"],
-                
-                # 爬虫配置（环境配置优先）
-                max_items=self._env_config.get('MAX_ITEMS') if self._env_config.get('MAX_ITEMS') is not None else config_data["crawler"]["max_items"],
-                request_interval=self._env_config.get('REQUEST_INTERVAL') if self._env_config.get('REQUEST_INTERVAL') is not None else config_data["crawler"]["request_interval"],
-                skip_top_item=config_data["crawler"]["skip_top_item"],
-                enable_cache=config_data["crawler"]["enable_cache"],
-                cache_duration=config_data["crawler"]["cache_duration"],
-                concurrent_requests=config_data["crawler"]["concurrent_requests"],
-                
-                # 浏览器配置
-                browser_headless=self._env_config.get('BROWSER_HEADLESS', config_data.get("browser", {}).get("headless", False)),
-                browser_disable_dev_shm_usage=config_data.get("browser", {}).get("disable_dev_shm_usage", True),
-                browser_no_sandbox=config_data.get("browser", {}).get("no_sandbox", False),
-                
-                # 视频下载配置
-                video_download_enabled=self._env_config.get('VIDEO_DOWNLOAD_ENABLED', config_data.get("video_download", {}).get("enabled", False)),
-                video_download_dir=self._env_config.get('VIDEO_DOWNLOAD_DIR', config_data.get("video_download", {}).get("download_dir", "downloads")),
-                video_download_max_file_size=config_data.get("video_download", {}).get("max_file_size", 209715200),
-                video_download_max_concurrent=config_data.get("video_download", {}).get("max_concurrent", 3),
-                video_download_timeout=config_data.get("video_download", {}).get("timeout", 30),
-                video_download_chunk_size=config_data.get("video_download", {}).get("chunk_size", 8192),
-                video_download_max_retries=config_data.get("video_download", {}).get("max_retries", 3),
-                video_download_retry_delay=config_data.get("video_download", {}).get("retry_delay", 1.0),
-                video_download_auto_download=config_data.get("video_download", {}).get("auto_download", False),
-                
-                # 输出配置
-                output_format=config_data["output"]["format"],
-                output_indent=config_data["output"]["indent"],
-                ensure_ascii=config_data["output"]["ensure_ascii"],
-                output_default_path=config_data["output"].get("default_path", "data"),
-                output_filename_template=config_data["output"].get("filename_template", "douyin_hotlist_{timestamp}"),
-                
-                # 日志配置
-                log_level=config_data["logging"]["level"],
-                console_log_level=config_data["logging"]["console_level"],
-                file_log_level=config_data["logging"]["file_level"],
-                log_file_path=config_data["logging"]["log_file"],
-                log_max_file_size=config_data["logging"]["max_file_size"],
-                log_backup_count=config_data["logging"]["backup_count"],
-                log_format=config_data["logging"]["format"],
-                log_date_format=config_data["logging"]["date_format"],
-                
-                # URL编码配置
-                url_encoding_enabled=config_data.get("url_encoding", {}).get("enabled", True),
-                url_encoding_method=config_data.get("url_encoding", {}).get("method", "url_encode"),
-                url_encoding_encoding=config_data.get("url_encoding", {}).get("encoding", "utf-8"),
-                url_encoding_safe_chars=config_data.get("url_encoding", {}).get("safe_chars", ""),
-                
-                # 高级配置项
-                enable_proxy=self._env_config.get('ENABLE_PROXY', False),
-                proxy_config=self._env_config.get('PROXY_CONFIG', {}),
-                enable_rate_limit=self._env_config.get('ENABLE_RATE_LIMIT', True),
-                rate_limit_requests=self._env_config.get('RATE_LIMIT_REQUESTS', 10),
-                rate_limit_period=self._env_config.get('RATE_LIMIT_PERIOD', 60),
-                enable_retry_backoff=self._env_config.get('ENABLE_RETRY_BACKOFF', True),
-                max_concurrent_workers=self._env_config.get('MAX_CONCURRENT_WORKERS', 3),
-                debug=self._env_config.get('DEBUG', False),
-            )
-            
-            # 验证配置有效性
-            self._config.validate()
-            
+        
+        with self._config_lock:
+            if self._config is None:
+                self._config = self._build_config()
             return self._config
-            
-        except Exception as e:
-            raise RuntimeError(f"配置加载失败: {e}")
+    
+    def _build_config(self) -> AppConfig:
+        """
+        从配置文件和环境配置构建并验证新的配置对象，再应用 update_config 记录的覆盖项
+        
+        只返回新对象，不修改当前已发布的配置；调用方需持有 _config_lock。
+        
+        @returns {AppConfig} 新的配置对象
+        """
+        # 加载基础配置文件
+        config_file = self._config_file
+        try:
+            config_data = self._read_cached(config_file, lambda data, _: _json_loads(data))
+        except FileNotFoundError:
+            raise FileNotFoundError(get_error_message('config_not_found', str(config_file)))
+        except _JSON_DECODE_ERRORS as e:
+            raise RuntimeError(f"配置加载失败: 配置文件不是有效的JSON: {e}") from e
+        
+        # 加载环境配置
+        self._load_env_config()
+        
+        # 创建配置对象，环境配置优先
+        try:
+            config = _build_app_config(config_data, self._env_config)
+        except (KeyError, TypeError, AttributeError) as e:
+            raise RuntimeError(f"配置加载失败: 配置文件缺少必要的配置项或格式错误: {e}") from e
+        
+        # 验证配置有效性，通过后才缓存
+        config.validate()
+        if self._overrides:
+            config = dataclasses.replace(config, **self._overrides)
+            config.validate(self._overrides.keys())
+        return config
     
     def _load_env_config(self) -> None:
         """
         加载环境配置
         
-        从env_config.py文件中动态加载环境变量配置。
+        从environment.py文件中读取环境变量配置。文件中只有字面量赋值时只做语法解析，
+        存在非字面量配置项时回退为执行文件；文件未变化时复用上次的解析结果。
         环境配置会覆盖默认配置，提供更灵活的配置管理。
         
         @returns {None}
@@ -584,38 +922,31 @@ class ConfigManager:
             REQUEST_INTERVAL = 3
             ENABLE_PROXY = True
         """
-        env_config_file = self.config_dir / "environment.py"
-        
-        if env_config_file.exists():
-            try:
-                # 动态导入环境配置文件
-                spec = importlib.util.spec_from_file_location("env_config", env_config_file)
-                env_config = importlib.util.module_from_spec(spec)
-                spec.loader.exec_module(env_config)
-                
-                # 获取所有非私有配置项
-                for attr_name in dir(env_config):
-                    if not attr_name.startswith('_'):
-                        attr_value = getattr(env_config, attr_name)
-                        if not callable(attr_value):
-                            self._env_config[attr_name] = attr_value
-                            
-            except Exception as e:
-                # 使用日志记录而不是print输出
-                import logging
-                logger = logging.getLogger(__name__)
-                logger.warning(f"环境配置加载失败，使用默认配置: {e}")
-        else:
+        try:
+            self._env_config = dict(self._read_cached(self._env_file, _parse_env_file))
+        except FileNotFoundError:
             # 使用日志记录而不是print输出
-            import logging
-            logger = logging.getLogger(__name__)
-            logger.debug("未找到environment.py文件，使用默认配置")
+            self._env_config = {}
+            _logger.debug("未找到environment.py文件，使用默认配置")
+        except (SyntaxError, ValueError, OSError, ImportError) as e:
+            self._env_config = {}
+            # 同一错误只警告一次，避免热重载反复触发时刷屏
+            error = str(e)
+            if error != self._env_error:
+                self._env_error = error
+                _logger.warning("环境配置加载失败，使用默认配置: %s", error)
+            else:
+                _logger.debug("环境配置加载失败，使用默认配置: %s", error)
+        else:
+            self._env_error = None
     
     def reload_config(self) -> AppConfig:
         """
         重新加载配置
         
-        清除当前配置缓存，重新从配置文件和环境变量加载配置。
+        重新从配置文件和环境变量加载配置，并再次应用 update_config 设置的覆盖项
+        （保持 命令行 > environment.py > config.json 的优先级）。
+        新配置构建并验证成功后才替换当前配置，失败时当前配置保持不变。
         适用于配置更新后需要立即生效的场景。
         
         @returns {AppConfig} 重新加载后的配置对象
@@ -631,9 +962,10 @@ class ConfigManager:
             config = config_manager.reload_config()
             print("配置已重新加载")
         """
-        self._config = None
-        self._env_config = {}
-        return self.load_config()
+        with self._config_lock:
+            config = self._build_config()
+            self._config = config
+            return config
     
     def get_config(self) -> AppConfig:
         """
@@ -658,7 +990,8 @@ class ConfigManager:
         动态更新配置项
         
         在运行时动态更新配置参数，支持部分配置更新。
-        更新后会自动验证配置的有效性。
+        更新后会自动验证配置的有效性，验证失败时保留原配置。
+        配置对象不可变，更新后需重新调用 get_config() 获取新对象。
         
         @param {**kwargs} kwargs - 要更新的配置项，支持任意数量的配置参数
         @returns {None}
@@ -678,15 +1011,130 @@ class ConfigManager:
                 enable_cache=True
             )
         """
-        if self._config is None:
-            self.load_config()
-            
-        # 逐个更新配置项
-        for key, value in kwargs.items():
-            if hasattr(self._config, key):
-                setattr(self._config, key, value)
-            else:
+        # 检查配置项是否存在
+        for key in kwargs:
+            if key not in _APP_CONFIG_FIELDS:
                 raise ValueError(f"未知的配置项: {key}")
         
-        # 重新验证配置有效性
-        self._config.validate()
+        with self._config_lock:
+            # 生成新的配置对象，当前配置已验证过，只需验证变化的字段，通过后再替换
+            new_config = dataclasses.replace(self.load_config(), **kwargs)
+            new_config.validate(kwargs.keys())
+            # 记录覆盖项，重新加载配置文件后再次应用
+            self._overrides.update(kwargs)
+            self._config = new_config
+    
+    def render_output_filename(self, now: Optional[datetime] = None) -> str:
+        """
+        按当前配置的文件名模板渲染输出文件名
+        
+        @param {Optional[datetime]} now - 时间点，为None时使用当前时间
+        @returns {str} 不含扩展名的文件名
+        
+        @example
+            filename = f"{config_manager.render_output_filename()}.json"
+        """
+        return render_output_filename(self.get_config().output_filename_template, now)
+    
+    def start_watching(self, callback: Optional[Callable[[AppConfig], None]] = None,
+                       debounce: float = 0.25) -> None:
+        """
+        监听配置文件变化并自动重新加载
+        
+        基于 watchdog 的文件系统事件触发重新加载，配置未变化时不消耗CPU。
+        短时间内的多次写入会合并为一次重新加载。
+        
+        @param {Optional[Callable[[AppConfig], None]]} callback - 重新加载成功后的回调，参数为新配置
+        @param {float} debounce - 合并连续变更的等待时间(秒)
+        @returns {None}
+        
+        @throws {ConfigurationException} 当未安装 watchdog 时抛出
+        
+        @example
+            config_manager = ConfigManager.instance()
+            config_manager.start_watching(lambda config: print(f"配置已更新: {config.max_items}"))
+            ...
+            config_manager.stop_watching()
+        """
+        try:
+            from watchdog.events import FileSystemEventHandler
+            from watchdog.observers import Observer
+        except ImportError:
+            raise ConfigurationException(
+                "配置热重载需要安装 watchdog",
+                suggestion="执行 pip install watchdog 后重试"
+            )
+        
+        with self._watch_lock:
+            if self._observer is not None:
+                return
+            
+            watched_files = {
+                str(self._config_file),
+                str(self._env_file),
+            }
+            manager = self
+            
+            class _ConfigFileHandler(FileSystemEventHandler):
+                """只响应配置文件的变更事件（编辑器常以重命名方式保存，需同时检查目标路径）"""
+                
+                def _handle(self, event):
+                    if event.src_path in watched_files or getattr(event, "dest_path", None) in watched_files:
+                        manager._schedule_reload(callback, debounce)
+                
+                on_modified = on_created = on_moved = _handle
+            
+            observer = Observer()
+            observer.daemon = True
+            observer.schedule(_ConfigFileHandler(), str(self.config_dir), recursive=False)
+            observer.start()
+            self._observer = observer
+    
+    def stop_watching(self) -> None:
+        """
+        停止监听配置文件变化
+        
+        @returns {None}
+        """
+        with self._watch_lock:
+            observer, self._observer = self._observer, None
+            if self._reload_timer is not None:
+                self._reload_timer.cancel()
+                self._reload_timer = None
+        
+        if observer is not None:
+            observer.stop()
+            observer.join()
+    
+    def _schedule_reload(self, callback: Optional[Callable[[AppConfig], None]], debounce: float) -> None:
+        """
+        延迟执行重新加载，期间的新事件会重新计时
+        
+        @param {Optional[Callable[[AppConfig], None]]} callback - 重新加载成功后的回调
+        @param {float} debounce - 等待时间(秒)
+        @returns {None}
+        """
+        with self._watch_lock:
+            if self._observer is None:
+                return
+            if self._reload_timer is not None:
+                self._reload_timer.cancel()
+            self._reload_timer = threading.Timer(debounce, self._reload_from_watch, args=(callback,))
+            self._reload_timer.daemon = True
+            self._reload_timer.start()
+    
+    def _reload_from_watch(self, callback: Optional[Callable[[AppConfig], None]]) -> None:
+        """
+        文件变更触发的重新加载，失败时保留原配置
+        
+        @param {Optional[Callable[[AppConfig], None]]} callback - 重新加载成功后的回调
+        @returns {None}
+        """
+        try:
+            config = self.reload_config()
+        except Exception as e:
+            _logger.warning("配置文件变更后重新加载失败，继续使用原配置: %s", e)
+            return
+        
+        if callback is not None:
+            callback(config)
@@ -10,6 +10,7 @@
 主要常量分类:
 - API端点: 抖音API接口地址
 - 数据字段: JSON响应中的字段名
+- 字段组合: 解析时成组使用的字段
 - 文件扩展名: 支持的文件格式
 - 默认值: 系统默认配置参数
 - 状态码: HTTP响应状态码
@@ -22,36 +23,118 @@
 - 文件操作
 - 配置管理
 
+所有常量均定义为模块级名称，直接导入使用；Constants 类保留为兼容旧代码的命名空间。
+
 @example
+    from src.core.constants import API_SEARCH_LIST, DATA_FIELD, ERROR_MESSAGES
+    
     # 使用API端点常量
-    api_url = f"https://api.douyin.com/{Constants.API_SEARCH_LIST}"
+    api_url = f"https://api.douyin.com/{API_SEARCH_LIST}"
     
     # 使用数据字段常量
-    data = response.get(Constants.DATA_FIELD, {})
+    data = response.get(DATA_FIELD, {})
     
     # 使用错误消息常量
-    error_msg = Constants.ERROR_MESSAGES['request_failed']
+    error_msg = ERROR_MESSAGES['request_failed']
 """
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Optional
+
+
+# API端点常量 - 抖音API接口地址
+API_SEARCH_LIST = "search/list"        # 搜索列表API
+API_AWEME_DETAIL = "aweme/detail"      # 视频详情API
+
+# 数据字段名常量 - JSON响应中的字段名
+DATA_FIELD = "data"                    # 数据主字段
+WORD_LIST_FIELD = "word_list"          # 热词列表字段
+AWEME_DETAIL_FIELD = "aweme_detail"    # 视频详情字段
+ACTIVE_TIME_FIELD = "active_time"      # 活跃时间字段
+
+# 热榜项目字段常量 - 热榜数据结构中的字段名
+SENTENCE_ID_FIELD = "sentence_id"      # 句子ID字段
+WORD_FIELD = "word"                    # 热词字段
+POSITION_FIELD = "position"            # 位置字段
+HOT_VALUE_FIELD = "hot_value"          # 热度值字段
+VIEW_COUNT_FIELD = "view_count"        # 浏览量字段
+
+# 视频字段常量 - 视频数据结构中的字段名
+AWEME_ID_FIELD = "aweme_id"            # 视频ID字段
+DESC_FIELD = "desc"                    # 描述字段
+VIDEO_FIELD = "video"                  # 视频字段
+BIT_RATE_FIELD = "bit_rate"            # 比特率字段
+PLAY_ADDR_FIELD = "play_addr"          # 播放地址字段
+URL_LIST_FIELD = "url_list"            # URL列表字段
+
+# 字段组合常量 - 同一数据结构中一起使用的字段，解析时直接复用预先构建好的元组
+HOT_LIST_ITEM_REQUIRED_FIELDS = (      # 热榜项目必需字段
+    SENTENCE_ID_FIELD,
+    WORD_FIELD,
+    POSITION_FIELD,
+    HOT_VALUE_FIELD,
+    VIEW_COUNT_FIELD,
+)
+VIDEO_PLAY_URL_PATH = (                # 视频详情中首个播放地址的访问路径
+    VIDEO_FIELD, BIT_RATE_FIELD, 0, PLAY_ADDR_FIELD, URL_LIST_FIELD, 0,
+)
+
+# 文件扩展名常量 - 支持的文件格式
+JSON_EXT = ".json"                     # JSON文件扩展名
+CSV_EXT = ".csv"                       # CSV文件扩展名
+LOG_EXT = ".log"                       # 日志文件扩展名
+
+# 默认值常量 - 系统默认配置参数
+DEFAULT_TIMEOUT = 30                   # 默认超时时间(秒)
+DEFAULT_MAX_RETRIES = 3                # 默认最大重试次数
+DEFAULT_DELAY = 2                      # 默认延迟时间(秒)
+DEFAULT_MAX_ITEMS = 10                 # 默认最大项目数
+
+# 状态码常量 - HTTP响应状态码
+SUCCESS = 200                          # 成功状态码
+TIMEOUT = 408                          # 超时状态码
+RATE_LIMIT = 429                       # 限流状态码
+
+# 错误消息常量 - 预定义的错误信息（只读映射）
+ERROR_MESSAGES = MappingProxyType({
+    'config_not_found': '配置文件不存在',           # 配置文件不存在错误
+    'invalid_url': 'URL格式无效',                  # URL格式错误
+    'request_failed': '请求失败',                  # 请求失败错误
+    'data_parse_error': '数据解析错误',            # 数据解析错误
+    'browser_init_failed': '浏览器初始化失败'      # 浏览器初始化错误
+})
+
+
+@lru_cache(maxsize=256)
+def get_error_message(code: str, detail: Optional[str] = None) -> str:
+    """
+    获取预定义错误消息
+    
+    相同参数的结果会被缓存，重试循环中反复出现的同一错误直接复用已拼接的字符串。
+    
+    @param {str} code - 错误代码，对应 ERROR_MESSAGES 的键
+    @param {Optional[str]} detail - 附加说明，提供时以 "消息: 说明" 的格式拼接
+    @returns {str} 错误消息
+    @throws {KeyError} 当错误代码不存在时抛出
+    
+    @example
+        get_error_message('config_not_found', 'config.json')  # '配置文件不存在: config.json'
+    """
+    message = ERROR_MESSAGES[code]
+    return message if detail is None else f"{message}: {detail}"
 
 
 class Constants:
     """
     应用常量类
     
-    定义抖音爬虫系统中使用的所有常量值，提供统一的常量管理。
+    兼容旧代码的常量命名空间，所有属性均引用同名的模块级常量。
+    新代码建议直接从本模块导入常量，访问时少一次属性查找。
     
     @author: MingTechPro
     @version: 1.0.0
     @date: 2025-08-15
     
-    常量分类:
-    - API端点: 抖音API接口地址
-    - 数据字段: JSON响应中的字段名
-    - 文件扩展名: 支持的文件格式
-    - 默认值: 系统默认配置参数
-    - 状态码: HTTP响应状态码
-    - 错误消息: 预定义的错误信息
-    
     @example
         # 获取API端点
         search_api = Constants.API_SEARCH_LIST
@@ -63,52 +146,51 @@ class Constants:
         error_msg = Constants.ERROR_MESSAGES['request_failed']
     """
     
-    # API端点常量 - 抖音API接口地址
-    API_SEARCH_LIST = "search/list"        # 搜索列表API
-    API_AWEME_DETAIL = "aweme/detail"      # 视频详情API
-    
-    # 数据字段名常量 - JSON响应中的字段名
-    DATA_FIELD = "data"                    # 数据主字段
-    WORD_LIST_FIELD = "word_list"          # 热词列表字段
-    AWEME_DETAIL_FIELD = "aweme_detail"    # 视频详情字段
-    ACTIVE_TIME_FIELD = "active_time"      # 活跃时间字段
-    
-    # 热榜项目字段常量 - 热榜数据结构中的字段名
-    SENTENCE_ID_FIELD = "sentence_id"      # 句子ID字段
-    WORD_FIELD = "word"                    # 热词字段
-    POSITION_FIELD = "position"            # 位置字段
-    HOT_VALUE_FIELD = "hot_value"          # 热度值字段
-    VIEW_COUNT_FIELD = "view_count"        # 浏览量字段
-    
-    # 视频字段常量 - 视频数据结构中的字段名
-    AWEME_ID_FIELD = "aweme_id"            # 视频ID字段
-    DESC_FIELD = "desc"                    # 描述字段
-    VIDEO_FIELD = "video"                  # 视频字段
-    BIT_RATE_FIELD = "bit_rate"            # 比特率字段
-    PLAY_ADDR_FIELD = "play_addr"          # 播放地址字段
-    URL_LIST_FIELD = "url_list"            # URL列表字段
-    
-    # 文件扩展名常量 - 支持的文件格式
-    JSON_EXT = ".json"                     # JSON文件扩展名
-    CSV_EXT = ".csv"                       # CSV文件扩展名
-    LOG_EXT = ".log"                       # 日志文件扩展名
-    
-    # 默认值常量 - 系统默认配置参数
-    DEFAULT_TIMEOUT = 30                   # 默认超时时间(秒)
-    DEFAULT_MAX_RETRIES = 3                # 默认最大重试次数
-    DEFAULT_DELAY = 2                      # 默认延迟时间(秒)
-    DEFAULT_MAX_ITEMS = 10                 # 默认最大项目数
-    
-    # 状态码常量 - HTTP响应状态码
-    SUCCESS = 200                          # 成功状态码
-    TIMEOUT = 408                          # 超时状态码
-    RATE_LIMIT = 429                       # 限流状态码
-    
-    # 错误消息常量 - 预定义的错误信息
-    ERROR_MESSAGES = {
-        'config_not_found': '配置文件不存在',           # 配置文件不存在错误
-        'invalid_url': 'URL格式无效',                  # URL格式错误
-        'request_failed': '请求失败',                  # 请求失败错误
-        'data_parse_error': '数据解析错误',            # 数据解析错误
-        'browser_init_failed': '浏览器初始化失败'      # 浏览器初始化错误
-    }
+    # API端点
+    API_SEARCH_LIST = API_SEARCH_LIST
+    API_AWEME_DETAIL = API_AWEME_DETAIL
+    
+    # 数据字段
+    DATA_FIELD = DATA_FIELD
+    WORD_LIST_FIELD = WORD_LIST_FIELD
+    AWEME_DETAIL_FIELD = AWEME_DETAIL_FIELD
+    ACTIVE_TIME_FIELD = ACTIVE_TIME_FIELD
+    
+    # 热榜项目字段
+    SENTENCE_ID_FIELD = SENTENCE_ID_FIELD
+    WORD_FIELD = WORD_FIELD
+    POSITION_FIELD = POSITION_FIELD
+    HOT_VALUE_FIELD = HOT_VALUE_FIELD
+    VIEW_COUNT_FIELD = VIEW_COUNT_FIELD
+    
+    # 视频字段
+    AWEME_ID_FIELD = AWEME_ID_FIELD
+    DESC_FIELD = DESC_FIELD
+    VIDEO_FIELD = VIDEO_FIELD
+    BIT_RATE_FIELD = BIT_RATE_FIELD
+    PLAY_ADDR_FIELD = PLAY_ADDR_FIELD
+    URL_LIST_FIELD = URL_LIST_FIELD
+    
+    # 字段组合
+    HOT_LIST_ITEM_REQUIRED_FIELDS = HOT_LIST_ITEM_REQUIRED_FIELDS
+    VIDEO_PLAY_URL_PATH = VIDEO_PLAY_URL_PATH
+    
+    # 文件扩展名
+    JSON_EXT = JSON_EXT
+    CSV_EXT = CSV_EXT
+    LOG_EXT = LOG_EXT
+    
+    # 默认值
+    DEFAULT_TIMEOUT = DEFAULT_TIMEOUT
+    DEFAULT_MAX_RETRIES = DEFAULT_MAX_RETRIES
+    DEFAULT_DELAY = DEFAULT_DELAY
+    DEFAULT_MAX_ITEMS = DEFAULT_MAX_ITEMS
+    
+    # 状态码
+    SUCCESS = SUCCESS
+    TIMEOUT = TIMEOUT
+    RATE_LIMIT = RATE_LIMIT
+    
+    # 错误消息
+    ERROR_MESSAGES = ERROR_MESSAGES
+    get_error_message = staticmethod(get_error_message)
@@ -36,10 +36,19 @@
         # 通用错误处理
 """
 
-from typing import Optional, Dict, Any
+import sys
+import time
+import inspect
+import logging
+import functools
+from types import MappingProxyType
+from typing import Optional, Dict, Any, Mapping, Type
 from datetime import datetime
 
 
+_logger = logging.getLogger(__name__)
+
+
 class DouyinSpiderException(Exception):
     """
     抖音爬虫基础异常类
@@ -54,6 +63,7 @@ class DouyinSpiderException(Exception):
     - message: 错误消息
     - error_code: 错误代码
     - timestamp: 异常发生时间
+    - timestamp_ns: 异常发生时间（Unix纳秒时间戳）
     - context: 异常上下文信息
     - suggestion: 解决建议
     
@@ -66,9 +76,16 @@ class DouyinSpiderException(Exception):
         )
     """
     
+    # 子类通过覆盖以下类属性提供默认值，无需重写 __init__。
+    # error_code 与 suggestion 使用默认值时直接从类上读取，
+    # 只有调用方传入其他值时才写入实例
+    DEFAULT_MESSAGE: str = "未知错误"
+    error_code: str = "UNKNOWN"
+    suggestion: Optional[str] = None
+    
     def __init__(
         self, 
-        message: str, 
+        message: Optional[str] = None, 
         error_code: Optional[str] = None,
         context: Optional[Dict[str, Any]] = None,
         suggestion: Optional[str] = None
@@ -76,17 +93,41 @@ class DouyinSpiderException(Exception):
         """
         初始化异常
         
-        @param {str} message - 错误消息
-        @param {Optional[str]} error_code - 错误代码
+        @param {Optional[str]} message - 错误消息，默认为类属性 DEFAULT_MESSAGE
+        @param {Optional[str]} error_code - 错误代码，默认为类属性 error_code
         @param {Optional[Dict[str, Any]]} context - 异常上下文信息
-        @param {Optional[str]} suggestion - 解决建议
+        @param {Optional[str]} suggestion - 解决建议，默认为类属性 suggestion
         """
+        if message is None:
+            message = self.DEFAULT_MESSAGE
         super().__init__(message)
         self.message = message
-        self.error_code = error_code or "UNKNOWN"
-        self.timestamp = datetime.now()
-        self.context = context or {}
-        self.suggestion = suggestion
+        if error_code:
+            # 类属性中的字面量错误代码已由编译器驻留；调用方传入的代码可能是运行时拼接的，
+            # 同样驻留后，按错误代码比较或作为字典键时可直接命中身份比较
+            self.error_code = sys.intern(error_code)
+        # 只记录整数纳秒时间戳，datetime 对象和空的上下文字典在首次访问时才创建，
+        # 被捕获后直接丢弃的异常几乎没有额外开销
+        self.timestamp_ns = time.time_ns()
+        self._context = context or None
+        if suggestion is not None:
+            self.suggestion = suggestion
+    
+    @property
+    def timestamp(self) -> datetime:
+        """异常发生时间，由 timestamp_ns 按需转换"""
+        return datetime.fromtimestamp(self.timestamp_ns / 1e9)
+    
+    @property
+    def context(self) -> Dict[str, Any]:
+        """异常上下文信息"""
+        if self._context is None:
+            self._context = {}
+        return self._context
+    
+    @context.setter
+    def context(self, value: Optional[Dict[str, Any]]) -> None:
+        self._context = value or None
     
     def to_dict(self) -> Dict[str, Any]:
         """
@@ -99,16 +140,15 @@ class DouyinSpiderException(Exception):
             "message": self.message,
             "error_code": self.error_code,
             "timestamp": self.timestamp.isoformat(),
-            "context": self.context,
+            "context": self._context or {},
             "suggestion": self.suggestion
         }
     
     def __str__(self) -> str:
         """返回格式化的错误消息"""
-        base_msg = f"[{self.error_code}] {self.message}"
         if self.suggestion:
-            base_msg += f" | 建议: {self.suggestion}"
-        return base_msg
+            return f"[{self.error_code}] {self.message} | 建议: {self.suggestion}"
+        return f"[{self.error_code}] {self.message}"
 
 
 class ConfigurationException(DouyinSpiderException):
@@ -126,9 +166,7 @@ class ConfigurationException(DouyinSpiderException):
         )
     """
     
-    def __init__(self, message: str, **kwargs):
-        kwargs.setdefault('error_code', 'CONFIG_001')
-        super().__init__(message, **kwargs)
+    error_code = "CONFIG_001"
 
 
 class NetworkException(DouyinSpiderException):
@@ -146,36 +184,31 @@ class NetworkException(DouyinSpiderException):
         )
     """
     
-    def __init__(self, message: str, **kwargs):
-        kwargs.setdefault('error_code', 'NETWORK_001')
-        super().__init__(message, **kwargs)
+    error_code = "NETWORK_001"
 
 
 class RequestTimeoutException(NetworkException):
     """请求超时异常"""
     
-    def __init__(self, message: str = "请求超时", **kwargs):
-        kwargs.setdefault('error_code', 'NETWORK_002')
-        kwargs.setdefault('suggestion', '检查网络连接或增加超时时间')
-        super().__init__(message, **kwargs)
+    DEFAULT_MESSAGE = "请求超时"
+    error_code = "NETWORK_002"
+    suggestion = "检查网络连接或增加超时时间"
 
 
 class ConnectionException(NetworkException):
     """连接异常"""
     
-    def __init__(self, message: str = "连接失败", **kwargs):
-        kwargs.setdefault('error_code', 'NETWORK_003')
-        kwargs.setdefault('suggestion', '检查网络连接和目标服务器状态')
-        super().__init__(message, **kwargs)
+    DEFAULT_MESSAGE = "连接失败"
+    error_code = "NETWORK_003"
+    suggestion = "检查网络连接和目标服务器状态"
 
 
 class RateLimitException(NetworkException):
     """速率限制异常"""
     
-    def __init__(self, message: str = "请求频率过高", **kwargs):
-        kwargs.setdefault('error_code', 'NETWORK_004')
-        kwargs.setdefault('suggestion', '降低请求频率或使用代理')
-        super().__init__(message, **kwargs)
+    DEFAULT_MESSAGE = "请求频率过高"
+    error_code = "NETWORK_004"
+    suggestion = "降低请求频率或使用代理"
 
 
 class DataException(DouyinSpiderException):
@@ -193,36 +226,31 @@ class DataException(DouyinSpiderException):
         )
     """
     
-    def __init__(self, message: str, **kwargs):
-        kwargs.setdefault('error_code', 'DATA_001')
-        super().__init__(message, **kwargs)
+    error_code = "DATA_001"
 
 
 class DataParseException(DataException):
     """数据解析异常"""
     
-    def __init__(self, message: str = "数据解析失败", **kwargs):
-        kwargs.setdefault('error_code', 'DATA_002')
-        kwargs.setdefault('suggestion', '检查数据格式和解析逻辑')
-        super().__init__(message, **kwargs)
+    DEFAULT_MESSAGE = "数据解析失败"
+    error_code = "DATA_002"
+    suggestion = "检查数据格式和解析逻辑"
 
 
 class DataValidationException(DataException):
     """数据验证异常"""
     
-    def __init__(self, message: str = "数据验证失败", **kwargs):
-        kwargs.setdefault('error_code', 'DATA_003')
-        kwargs.setdefault('suggestion', '检查数据完整性和有效性')
-        super().__init__(message, **kwargs)
+    DEFAULT_MESSAGE = "数据验证失败"
+    error_code = "DATA_003"
+    suggestion = "检查数据完整性和有效性"
 
 
 class EmptyDataException(DataException):
     """数据为空异常"""
     
-    def __init__(self, message: str = "获取到的数据为空", **kwargs):
-        kwargs.setdefault('error_code', 'DATA_004')
-        kwargs.setdefault('suggestion', '检查API接口或调整查询参数')
-        super().__init__(message, **kwargs)
+    DEFAULT_MESSAGE = "获取到的数据为空"
+    error_code = "DATA_004"
+    suggestion = "检查API接口或调整查询参数"
 
 
 class SecurityException(DouyinSpiderException):
@@ -240,36 +268,31 @@ class SecurityException(DouyinSpiderException):
         )
     """
     
-    def __init__(self, message: str, **kwargs):
-        kwargs.setdefault('error_code', 'SECURITY_001')
-        super().__init__(message, **kwargs)
+    error_code = "SECURITY_001"
 
 
 class InvalidCookieException(SecurityException):
     """无效Cookie异常"""
     
-    def __init__(self, message: str = "Cookie无效或已过期", **kwargs):
-        kwargs.setdefault('error_code', 'SECURITY_002')
-        kwargs.setdefault('suggestion', '重新获取有效的Cookie')
-        super().__init__(message, **kwargs)
+    DEFAULT_MESSAGE = "Cookie无效或已过期"
+    error_code = "SECURITY_002"
+    suggestion = "重新获取有效的Cookie"
 
 
 class PermissionDeniedException(SecurityException):
     """权限拒绝异常"""
     
-    def __init__(self, message: str = "访问权限不足", **kwargs):
-        kwargs.setdefault('error_code', 'SECURITY_003')
-        kwargs.setdefault('suggestion', '检查账号权限或使用管理员权限')
-        super().__init__(message, **kwargs)
+    DEFAULT_MESSAGE = "访问权限不足"
+    error_code = "SECURITY_003"
+    suggestion = "检查账号权限或使用管理员权限"
 
 
 class SuspiciousActivityException(SecurityException):
     """可疑活动异常"""
     
-    def __init__(self, message: str = "检测到可疑活动", **kwargs):
-        kwargs.setdefault('error_code', 'SECURITY_004')
-        kwargs.setdefault('suggestion', '暂停操作，检查安全设置')
-        super().__init__(message, **kwargs)
+    DEFAULT_MESSAGE = "检测到可疑活动"
+    error_code = "SECURITY_004"
+    suggestion = "暂停操作，检查安全设置"
 
 
 class BrowserException(DouyinSpiderException):
@@ -287,36 +310,31 @@ class BrowserException(DouyinSpiderException):
         )
     """
     
-    def __init__(self, message: str, **kwargs):
-        kwargs.setdefault('error_code', 'BROWSER_001')
-        super().__init__(message, **kwargs)
+    error_code = "BROWSER_001"
 
 
 class BrowserInitException(BrowserException):
     """浏览器初始化异常"""
     
-    def __init__(self, message: str = "浏览器初始化失败", **kwargs):
-        kwargs.setdefault('error_code', 'BROWSER_002')
-        kwargs.setdefault('suggestion', '检查浏览器安装和驱动程序')
-        super().__init__(message, **kwargs)
+    DEFAULT_MESSAGE = "浏览器初始化失败"
+    error_code = "BROWSER_002"
+    suggestion = "检查浏览器安装和驱动程序"
 
 
 class PageLoadException(BrowserException):
     """页面加载异常"""
     
-    def __init__(self, message: str = "页面加载失败", **kwargs):
-        kwargs.setdefault('error_code', 'BROWSER_003')
-        kwargs.setdefault('suggestion', '检查网络连接和页面URL')
-        super().__init__(message, **kwargs)
+    DEFAULT_MESSAGE = "页面加载失败"
+    error_code = "BROWSER_003"
+    suggestion = "检查网络连接和页面URL"
 
 
 class ElementNotFoundException(BrowserException):
     """元素未找到异常"""
     
-    def __init__(self, message: str = "页面元素未找到", **kwargs):
-        kwargs.setdefault('error_code', 'BROWSER_004')
-        kwargs.setdefault('suggestion', '检查页面结构变化或选择器')
-        super().__init__(message, **kwargs)
+    DEFAULT_MESSAGE = "页面元素未找到"
+    error_code = "BROWSER_004"
+    suggestion = "检查页面结构变化或选择器"
 
 
 class ValidationException(DouyinSpiderException):
@@ -334,36 +352,100 @@ class ValidationException(DouyinSpiderException):
         )
     """
     
-    def __init__(self, message: str, **kwargs):
-        kwargs.setdefault('error_code', 'VALIDATION_001')
-        super().__init__(message, **kwargs)
+    error_code = "VALIDATION_001"
 
 
 class ParameterValidationException(ValidationException):
     """参数验证异常"""
     
-    def __init__(self, message: str = "参数验证失败", **kwargs):
-        kwargs.setdefault('error_code', 'VALIDATION_002')
-        kwargs.setdefault('suggestion', '检查参数值和类型')
-        super().__init__(message, **kwargs)
+    DEFAULT_MESSAGE = "参数验证失败"
+    error_code = "VALIDATION_002"
+    suggestion = "检查参数值和类型"
 
 
 class FormatValidationException(ValidationException):
     """格式验证异常"""
     
-    def __init__(self, message: str = "格式验证失败", **kwargs):
-        kwargs.setdefault('error_code', 'VALIDATION_003')
-        kwargs.setdefault('suggestion', '检查数据格式是否符合要求')
-        super().__init__(message, **kwargs)
+    DEFAULT_MESSAGE = "格式验证失败"
+    error_code = "VALIDATION_003"
+    suggestion = "检查数据格式是否符合要求"
 
 
 class ConstraintViolationException(ValidationException):
     """约束违反异常"""
     
-    def __init__(self, message: str = "约束条件违反", **kwargs):
-        kwargs.setdefault('error_code', 'VALIDATION_004')
-        kwargs.setdefault('suggestion', '检查业务规则和约束条件')
-        super().__init__(message, **kwargs)
+    DEFAULT_MESSAGE = "约束条件违反"
+    error_code = "VALIDATION_004"
+    suggestion = "检查业务规则和约束条件"
+
+
+# 异常工厂使用的错误类型 -> 异常类映射，未知类型回退到对应的基类
+_NETWORK_EXCEPTIONS: Dict[str, Type[NetworkException]] = {
+    "timeout": RequestTimeoutException,
+    "connection": ConnectionException,
+    "rate_limit": RateLimitException,
+}
+
+_DATA_EXCEPTIONS: Dict[str, Type[DataException]] = {
+    "parse": DataParseException,
+    "validation": DataValidationException,
+    "empty": EmptyDataException,
+}
+
+_SECURITY_EXCEPTIONS: Dict[str, Type[SecurityException]] = {
+    "cookie": InvalidCookieException,
+    "permission": PermissionDeniedException,
+    "suspicious": SuspiciousActivityException,
+}
+
+
+# 异常工厂函数
+def create_network_exception(
+    message: str, 
+    error_type: str = "general",
+    **context
+) -> NetworkException:
+    """
+    创建网络异常
+    
+    @param {str} message - 错误消息
+    @param {str} error_type - 错误类型 (timeout, connection, rate_limit)
+    @param {**context} context - 上下文信息
+    @returns {NetworkException} 网络异常实例
+    """
+    return _NETWORK_EXCEPTIONS.get(error_type, NetworkException)(message, context=context)
+
+
+def create_data_exception(
+    message: str,
+    error_type: str = "general",
+    **context
+) -> DataException:
+    """
+    创建数据异常
+    
+    @param {str} message - 错误消息
+    @param {str} error_type - 错误类型 (parse, validation, empty)
+    @param {**context} context - 上下文信息
+    @returns {DataException} 数据异常实例
+    """
+    return _DATA_EXCEPTIONS.get(error_type, DataException)(message, context=context)
+
+
+def create_security_exception(
+    message: str,
+    error_type: str = "general",
+    **context
+) -> SecurityException:
+    """
+    创建安全异常
+    
+    @param {str} message - 错误消息
+    @param {str} error_type - 错误类型 (cookie, permission, suspicious)
+    @param {**context} context - 上下文信息
+    @returns {SecurityException} 安全异常实例
+    """
+    return _SECURITY_EXCEPTIONS.get(error_type, SecurityException)(message, context=context)
 
 
 # 异常工厂类
@@ -371,7 +453,8 @@ class ExceptionFactory:
     """
     异常工厂类
     
-    提供便捷的异常创建方法和异常处理策略。
+    提供便捷的异常创建方法和异常处理策略。方法为模块级工厂函数的别名，
+    内部代码直接调用模块级函数。
     
     @example
         factory = ExceptionFactory()
@@ -379,81 +462,17 @@ class ExceptionFactory:
         raise exception
     """
     
-    @staticmethod
-    def create_network_exception(
-        message: str, 
-        error_type: str = "general",
-        **context
-    ) -> NetworkException:
-        """
-        创建网络异常
-        
-        @param {str} message - 错误消息
-        @param {str} error_type - 错误类型 (timeout, connection, rate_limit)
-        @param {**context} context - 上下文信息
-        @returns {NetworkException} 网络异常实例
-        """
-        if error_type == "timeout":
-            return RequestTimeoutException(message, context=context)
-        elif error_type == "connection":
-            return ConnectionException(message, context=context)
-        elif error_type == "rate_limit":
-            return RateLimitException(message, context=context)
-        else:
-            return NetworkException(message, context=context)
-    
-    @staticmethod
-    def create_data_exception(
-        message: str,
-        error_type: str = "general",
-        **context
-    ) -> DataException:
-        """
-        创建数据异常
-        
-        @param {str} message - 错误消息
-        @param {str} error_type - 错误类型 (parse, validation, empty)
-        @param {**context} context - 上下文信息
-        @returns {DataException} 数据异常实例
-        """
-        if error_type == "parse":
-            return DataParseException(message, context=context)
-        elif error_type == "validation":
-            return DataValidationException(message, context=context)
-        elif error_type == "empty":
-            return EmptyDataException(message, context=context)
-        else:
-            return DataException(message, context=context)
-    
-    @staticmethod
-    def create_security_exception(
-        message: str,
-        error_type: str = "general",
-        **context
-    ) -> SecurityException:
-        """
-        创建安全异常
-        
-        @param {str} message - 错误消息
-        @param {str} error_type - 错误类型 (cookie, permission, suspicious)
-        @param {**context} context - 上下文信息
-        @returns {SecurityException} 安全异常实例
-        """
-        if error_type == "cookie":
-            return InvalidCookieException(message, context=context)
-        elif error_type == "permission":
-            return PermissionDeniedException(message, context=context)
-        elif error_type == "suspicious":
-            return SuspiciousActivityException(message, context=context)
-        else:
-            return SecurityException(message, context=context)
+    create_network_exception = staticmethod(create_network_exception)
+    create_data_exception = staticmethod(create_data_exception)
+    create_security_exception = staticmethod(create_security_exception)
 
 
 # 异常处理装饰器
 def handle_exceptions(
     default_return=None,
     log_exceptions: bool = True,
-    reraise: bool = True
+    reraise: bool = True,
+    wrap_unknown: bool = True
 ):
     """
     异常处理装饰器
@@ -463,6 +482,8 @@ def handle_exceptions(
     @param {Any} default_return - 异常时的默认返回值
     @param {bool} log_exceptions - 是否记录异常日志
     @param {bool} reraise - 是否重新抛出异常
+    @param {bool} wrap_unknown - 重新抛出时是否将非自定义异常包装为 DouyinSpiderException，
+                                 为 False 时原样抛出，省去包装异常的创建和异常链
     @returns {function} 装饰器函数
     
     @example
@@ -472,40 +493,134 @@ def handle_exceptions(
             pass
     """
     def decorator(func):
-        def wrapper(*args, **kwargs):
-            try:
-                return func(*args, **kwargs)
-            except DouyinSpiderException as e:
-                if log_exceptions:
-                    import logging
-                    logger = logging.getLogger(__name__)
-                    logger.error(f"{func.__name__} 发生异常: {e}")
-                    logger.debug(f"异常详情: {e.to_dict()}")
-                
-                if reraise:
-                    raise
-                else:
+        # 不记录日志、原样重新抛出且不包装未知异常时，包装器不改变任何行为，
+        # 直接返回原函数，省去每次调用的额外栈帧和 try 块
+        if not log_exceptions and reraise and not wrap_unknown:
+            return func
+        
+        func_name = func.__name__
+        
+        def log_known(e: DouyinSpiderException) -> None:
+            if log_exceptions:
+                _logger.error("%s 发生异常: %s", func_name, e)
+                if _logger.isEnabledFor(logging.DEBUG):
+                    _logger.debug("异常详情: %s", e.to_dict())
+        
+        def handle_unknown(e: Exception):
+            # 在 except 块内调用，裸 raise 重新抛出的是当前正在处理的异常
+            if log_exceptions:
+                _logger.error("%s 发生未知异常: %s", func_name, e)
+            
+            if not reraise:
+                return default_return
+            if not wrap_unknown:
+                raise
+            # 将未知异常包装为自定义异常，异常文本只格式化一次
+            error_text = str(e)
+            raise DouyinSpiderException(
+                f"未知错误: {error_text}",
+                error_code="UNKNOWN_ERROR",
+                context={"original_exception": error_text}
+            ) from e
+        
+        # 按异常类型分派交给 except 子句完成：其子类检查在C层进行，
+        # 比先在Python层查询已知类型集合更快。
+        # 协程函数需要在 await 处捕获异常，否则调用只返回协程对象，异常不会经过包装器
+        if inspect.iscoroutinefunction(func):
+            @functools.wraps(func)
+            async def wrapper(*args, **kwargs):
+                try:
+                    return await func(*args, **kwargs)
+                except DouyinSpiderException as e:
+                    log_known(e)
+                    if reraise:
+                        raise
                     return default_return
-            except Exception as e:
-                if log_exceptions:
-                    import logging
-                    logger = logging.getLogger(__name__)
-                    logger.error(f"{func.__name__} 发生未知异常: {e}")
-                
-                if reraise:
-                    # 将未知异常包装为自定义异常
-                    raise DouyinSpiderException(
-                        f"未知错误: {str(e)}",
-                        error_code="UNKNOWN_ERROR",
-                        context={"original_exception": str(e)}
-                    ) from e
-                else:
+                except Exception as e:
+                    return handle_unknown(e)
+        else:
+            @functools.wraps(func)
+            def wrapper(*args, **kwargs):
+                try:
+                    return func(*args, **kwargs)
+                except DouyinSpiderException as e:
+                    log_known(e)
+                    if reraise:
+                        raise
                     return default_return
+                except Exception as e:
+                    return handle_unknown(e)
         
         return wrapper
     return decorator
 
 
+# 异常恢复策略表（按异常基类索引；策略及其动作列表均不可变，可安全地在调用方之间共享）
+_RECOVERY_STRATEGIES: Dict[type, Mapping[str, Any]] = {
+    NetworkException: MappingProxyType({
+        "retry": True,
+        "max_retries": 3,
+        "backoff_factor": 2.0,
+        "recovery_actions": (
+            "检查网络连接",
+            "尝试使用代理",
+            "增加超时时间",
+            "降低请求频率"
+        )
+    }),
+    DataException: MappingProxyType({
+        "retry": False,
+        "fallback_data": None,
+        "recovery_actions": (
+            "检查API响应格式",
+            "验证数据解析逻辑",
+            "使用备用数据源",
+            "忽略无效数据项"
+        )
+    }),
+    SecurityException: MappingProxyType({
+        "retry": False,
+        "require_manual_intervention": True,
+        "recovery_actions": (
+            "更新Cookie",
+            "检查账号状态",
+            "联系管理员",
+            "暂停操作"
+        )
+    }),
+    BrowserException: MappingProxyType({
+        "retry": True,
+        "max_retries": 2,
+        "recovery_actions": (
+            "重启浏览器",
+            "更新浏览器驱动",
+            "检查页面结构变化",
+            "使用备用选择器"
+        )
+    })
+}
+
+_DEFAULT_RECOVERY_STRATEGY: Mapping[str, Any] = MappingProxyType({
+    "retry": False,
+    "recovery_actions": ("查看日志获取更多信息", "联系技术支持")
+})
+
+
+@functools.lru_cache(maxsize=None)
+def _strategy_for(exception_type: type) -> Mapping[str, Any]:
+    """
+    查找异常类型对应的恢复策略，结果按类型缓存，每种类型只沿 MRO 查找一次
+    
+    @param {type} exception_type - 异常类型
+    @returns {Mapping[str, Any]} 恢复策略信息
+    """
+    return next(
+        (_RECOVERY_STRATEGIES[cls] for cls in exception_type.__mro__
+         if cls in _RECOVERY_STRATEGIES),
+        _DEFAULT_RECOVERY_STRATEGY
+    )
+
+
 # 异常恢复策略
 class RecoveryStrategy:
     """
@@ -515,66 +630,14 @@ class RecoveryStrategy:
     """
     
     @staticmethod
-    def get_recovery_strategy(exception: DouyinSpiderException) -> Dict[str, Any]:
+    def get_recovery_strategy(exception: DouyinSpiderException) -> Mapping[str, Any]:
         """
         获取异常恢复策略
         
+        按异常类型的 MRO 查找最近的已注册基类，结果按类型缓存。
+        返回的策略为共享的只读映射。
+        
         @param {DouyinSpiderException} exception - 异常实例
-        @returns {Dict[str, Any]} 恢复策略信息
+        @returns {Mapping[str, Any]} 恢复策略信息
         """
-        strategies = {
-            NetworkException: {
-                "retry": True,
-                "max_retries": 3,
-                "backoff_factor": 2.0,
-                "recovery_actions": [
-                    "检查网络连接",
-                    "尝试使用代理",
-                    "增加超时时间",
-                    "降低请求频率"
-                ]
-            },
-            DataException: {
-                "retry": False,
-                "fallback_data": None,
-                "recovery_actions": [
-                    "检查API响应格式",
-                    "验证数据解析逻辑",
-                    "使用备用数据源",
-                    "忽略无效数据项"
-                ]
-            },
-            SecurityException: {
-                "retry": False,
-                "require_manual_intervention": True,
-                "recovery_actions": [
-                    "更新Cookie",
-                    "检查账号状态",
-                    "联系管理员",
-                    "暂停操作"
-                ]
-            },
-            BrowserException: {
-                "retry": True,
-                "max_retries": 2,
-                "recovery_actions": [
-                    "重启浏览器",
-                    "更新浏览器驱动",
-                    "检查页面结构变化",
-                    "使用备用选择器"
-                ]
-            }
-        }
-        
-        exception_type = type(exception)
-        
-        # 查找最匹配的策略
-        for exc_class, strategy in strategies.items():
-            if issubclass(exception_type, exc_class):
-                return strategy
-        
-        # 默认策略
-        return {
-            "retry": False,
-            "recovery_actions": ["查看日志获取更多信息", "联系技术支持"]
-        }
+        return _strategy_for(type(exception))
@@ -37,13 +37,25 @@
         views=5000000
     )
 """
+import sys
+import json
 from dataclasses import dataclass, field
 from typing import List, Dict, Any, Optional
 from datetime import datetime
 from .exceptions import DataValidationException, ParameterValidationException
 
+# orjson 为可选依赖，存在时 to_json_bytes 用它序列化 to_dict() 的结果
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
-@dataclass
+# Python 3.10+ 为数据模型启用 slots，实例不再携带 __dict__，
+# 大量创建热榜项和视频文章时占用更少内存、属性访问更快
+_DATACLASS_OPTIONS: Dict[str, Any] = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(**_DATACLASS_OPTIONS)
 class VideoArticle:
     """
     视频文章信息数据类
@@ -168,7 +180,7 @@ class VideoArticle:
         }
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class HotListItem:
     """
     热榜项目数据类
@@ -203,6 +215,8 @@ class HotListItem:
     url: str                      # 热榜项目链接
     popularity: int               # 热度值
     views: int                    # 浏览量
+    # 生成的 __init__ 只在调用方未传入 articles 时才调用 list()，
+    # 传入列表时不会多分配，因此不需要改用 None 哨兵再在 __post_init__ 中补齐
     articles: List[VideoArticle] = field(default_factory=list)  # 关联的视频文章列表
     created_at: Optional[datetime] = None  # 创建时间
     
@@ -329,12 +343,12 @@ class HotListItem:
             "list_url": self.url,
             "list_popularity": self.popularity,
             "list_views": self.views,
-            "article": [article.to_dict() for article in self.articles],
+            "article": list(map(VideoArticle.to_dict, self.articles)),
             "created_at": self.created_at.isoformat() if self.created_at else None
         }
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class HotListResponse:
     """
     热榜响应数据类
@@ -376,13 +390,24 @@ class HotListResponse:
             # 结果: {"list": [], "total_count": 0, "fetch_time": None}
         """
         return {
-            "list": [item.to_dict() for item in self.items],
+            "list": list(map(HotListItem.to_dict, self.items)),
             "total_count": len(self.items),  # 自动计算实际数量
             "fetch_time": self.fetch_time.isoformat() if self.fetch_time else None
         }
+    
+    def to_json_bytes(self, indent: Optional[int] = None) -> bytes:
+        """
+        序列化为UTF-8编码的JSON字节串
+        
+        内容与 to_dict() 相同；缩进为 None 时输出紧凑格式（分隔符后不带空格）。
+        
+        @param {Optional[int]} indent - 缩进空格数，None 表示紧凑输出
+        @returns {bytes} JSON字节串
+        """
+        return _dumps_model(self, indent)
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class CrawlResult:
     """
     爬取结果数据类
@@ -417,6 +442,15 @@ class CrawlResult:
     items_processed: int = 0                        # 处理的项目数
     items_success: int = 0                          # 成功的项目数
     
+    @property
+    def success_rate(self) -> float:
+        """
+        计算成功率
+        
+        @returns {float} 成功率百分比，保留两位小数
+        """
+        return round(self.items_success / self.items_processed * 100, 2) if self.items_processed > 0 else 0
+    
     def to_dict(self) -> Dict[str, Any]:
         """
         转换为字典格式
@@ -437,11 +471,22 @@ class CrawlResult:
             "execution_time": self.execution_time,
             "items_processed": self.items_processed,
             "items_success": self.items_success,
-            "success_rate": round(self.items_success / self.items_processed * 100, 2) if self.items_processed > 0 else 0
+            "success_rate": self.success_rate
         }
+    
+    def to_json_bytes(self, indent: Optional[int] = None) -> bytes:
+        """
+        序列化为UTF-8编码的JSON字节串
+        
+        内容与 to_dict() 相同；缩进为 None 时输出紧凑格式（分隔符后不带空格）。
+        
+        @param {Optional[int]} indent - 缩进空格数，None 表示紧凑输出
+        @returns {bytes} JSON字节串
+        """
+        return _dumps_model(self, indent)
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class PerformanceMetrics:
     """
     性能指标数据类
@@ -494,3 +539,21 @@ class PerformanceMetrics:
         @returns {float} 每秒请求数
         """
         return round(self.request_count / self.total_time, 2) if self.total_time > 0 else 0.0
+
+
+def _dumps_model(model: Any, indent: Optional[int]) -> bytes:
+    """
+    将模型对象序列化为JSON字节串
+    
+    字段结构只由各模型的 to_dict() 定义。orjson 可用且缩进为 None 或2时由 orjson 序列化，
+    否则回退到 json；两种方式输出相同，紧凑输出时分隔符后均不带空格。
+    
+    @param {Any} model - 模型对象
+    @param {Optional[int]} indent - 缩进空格数
+    @returns {bytes} JSON字节串
+    """
+    data = model.to_dict()
+    if orjson is not None and indent in (None, 2):
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 if indent == 2 else 0)
+    separators = (",", ":") if indent is None else None
+    return json.dumps(data, ensure_ascii=False, indent=indent, separators=separators).encode('utf-8')
@@ -27,11 +27,16 @@
                 # 执行爬取逻辑
                 pass
 """
+import re
 import time
+import queue
 import logging
+import threading
+import weakref
 from abc import ABC, abstractmethod
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, List, Callable, Tuple
 from contextlib import contextmanager
+from functools import lru_cache, partial
 from dataclasses import dataclass
 from datetime import datetime
 
@@ -41,6 +46,47 @@ from ..core.constants import Constants
 from ..config.config_manager import AppConfig
 
 
+# clean_text 使用的字符替换表：换行、回车、制表符替换为空格，零宽度空格和BOM字符删除
+_CLEAN_TEXT_TABLE = str.maketrans({
+    '\n': ' ',
+    '\r': ' ',
+    '\t': ' ',
+    '\u200b': None,
+    '\ufeff': None,
+})
+
+# 连续空白（预编译，避免每次调用查询 re 模块的模式缓存）
+_WHITESPACE_RE = re.compile(r'\s+')
+
+# sanitize_url 需要删除的潜在恶意字符
+_URL_DANGEROUS_CHARS_TABLE = str.maketrans('', '', '"\'<>`\n\r\t')
+
+
+@lru_cache(maxsize=64)
+def compile_path(keys: Tuple[Any, ...]) -> Callable[..., Any]:
+    """
+    将固定的嵌套访问路径编译为取值函数
+    
+    与 BaseSpider.safe_get_nested_value 语义相同，但路径在编译时绑定，
+    对固定路径反复取值时省去每次传入路径和方法调用的开销。
+    
+    @param {Tuple[Any, ...]} keys - 键的路径，支持字符串和数字索引
+    @returns {Callable[..., Any]} 取值函数 accessor(data, default=None)
+    
+    @example
+        get_url = compile_path(("video", "play_addr", "url_list", 0))
+        url = get_url(video_data, "")
+    """
+    def accessor(data: Any, default: Any = None) -> Any:
+        try:
+            for key in keys:
+                data = data[key]
+            return data
+        except (KeyError, IndexError, TypeError):
+            return default
+    return accessor
+
+
 @dataclass
 class RequestResult:
     """
@@ -74,6 +120,127 @@ class RequestResult:
     status_code: Optional[int] = None               # HTTP状态码
 
 
+class BrowserPool:
+    """
+    浏览器实例池
+    
+    复用已启动的浏览器实例，避免每次爬取都重新启动Chromium。
+    每个实例被取出指定次数后关闭并在下次需要时重建，限制浏览器进程的内存增长。
+    
+    @example
+        pool = BrowserPool(ChromiumPage, size=2, recycle_after=100)
+        browser = pool.checkout()
+        try:
+            browser.get("https://www.douyin.com")
+        finally:
+            pool.checkin(browser)
+    """
+    
+    def __init__(self, factory: Callable[[], ChromiumPage], size: int = 2, recycle_after: int = 100):
+        """
+        初始化浏览器池
+        
+        @param {Callable[[], ChromiumPage]} factory - 创建浏览器实例的函数
+        @param {int} size - 池中最多保留的空闲实例数
+        @param {int} recycle_after - 单个实例最多被取出的次数，达到后关闭重建
+        """
+        self._factory = factory
+        self._recycle_after = recycle_after
+        self._idle: "queue.Queue[ChromiumPage]" = queue.Queue(maxsize=size)
+        self._uses: Dict[int, int] = {}
+        self._lock = threading.Lock()
+        self._logger = logging.getLogger(__name__)
+    
+    def checkout(self) -> ChromiumPage:
+        """
+        取出一个浏览器实例，池中没有空闲实例时新建
+        
+        @returns {ChromiumPage} 浏览器实例
+        """
+        try:
+            browser = self._idle.get_nowait()
+        except queue.Empty:
+            browser = self._factory()
+        with self._lock:
+            self._uses[id(browser)] = self._uses.get(id(browser), 0) + 1
+        return browser
+    
+    def checkin(self, browser: ChromiumPage, healthy: bool = True) -> None:
+        """
+        归还浏览器实例
+        
+        实例不健康、已达到复用次数上限或池已满时直接关闭。
+        
+        @param {ChromiumPage} browser - 浏览器实例
+        @param {bool} healthy - 实例是否可以继续使用
+        """
+        with self._lock:
+            uses = self._uses.get(id(browser), 0)
+        if healthy and uses < self._recycle_after:
+            try:
+                # 停止可能残留的网络监听，避免状态带到下一次使用
+                browser.listen.stop()
+                self._idle.put_nowait(browser)
+                return
+            except Exception:
+                pass
+        self._quit(browser)
+    
+    def close(self) -> None:
+        """关闭池中所有空闲的浏览器实例"""
+        while True:
+            try:
+                browser = self._idle.get_nowait()
+            except queue.Empty:
+                return
+            self._quit(browser)
+    
+    def _quit(self, browser: ChromiumPage) -> None:
+        """关闭浏览器实例并清除其使用计数"""
+        with self._lock:
+            self._uses.pop(id(browser), None)
+        _quit_browser(browser, self._logger)
+
+
+def _launch_browser(browser_args: Tuple[str, ...]) -> ChromiumPage:
+    """
+    按启动参数创建新的浏览器实例
+    
+    作为浏览器池的工厂函数使用，只依赖启动参数，不引用爬虫实例。
+    
+    @param {Tuple[str, ...]} browser_args - Chromium 启动参数
+    @returns {ChromiumPage} 浏览器实例
+    """
+    logger = logging.getLogger(__name__)
+    logger.info("🔄 初始化浏览器...")
+    
+    try:
+        # 尝试新版本的导入方式
+        from DrissionPage import ChromiumOptions
+    except ImportError:
+        try:
+            # 尝试旧版本的导入方式
+            from DrissionPage.configs.chromium_options import ChromiumOptions
+        except ImportError:
+            # 如果都失败，使用基本的ChromiumPage
+            logger.warning("无法导入ChromiumOptions，使用默认浏览器配置")
+            return ChromiumPage()
+    
+    options = ChromiumOptions()
+    for arg in browser_args:
+        options.set_argument(arg)
+    return ChromiumPage(addr_or_opts=options)
+
+
+def _quit_browser(browser: ChromiumPage, logger: logging.Logger) -> None:
+    """关闭浏览器实例，关闭失败只记录日志"""
+    try:
+        browser.quit()
+        logger.info("🔒 浏览器已关闭")
+    except Exception as e:
+        logger.error(f"关闭浏览器时出现错误：{str(e)}")
+
+
 class BaseSpider(ABC):
     """
     基础爬虫抽象类
@@ -125,15 +292,88 @@ class BaseSpider(ABC):
         self._request_count = 0      # 请求总数
         self._success_count = 0      # 成功请求数
         self._error_count = 0        # 失败请求数
+        self._stats_lock = threading.Lock()  # 并发获取详情时保护统计计数器
+        # 本实例的浏览器池（仅 browser_pool_size > 0 时创建）及创建它时使用的启动参数
+        self._browser_pool: Optional[BrowserPool] = None
+        self._browser_pool_args: Optional[Tuple[str, ...]] = None
+        # Cookie 和 User-Agent 初始化后不再变化，基础请求头只构建一次，每次调用返回其副本
+        self._base_headers: Dict[str, str] = {
+            "cookie": config.cookie,
+            "User-Agent": config.user_agent,
+        }
         
+    def _get_browser_pool(self, browser_args: Tuple[str, ...]) -> BrowserPool:
+        """
+        获取本实例的浏览器池
+        
+        启动参数发生变化（例如重新加载了配置）时关闭旧池，按新参数重建。
+        
+        @param {Tuple[str, ...]} browser_args - Chromium 启动参数
+        @returns {BrowserPool} 浏览器池
+        """
+        pool = self._browser_pool
+        if pool is None or self._browser_pool_args != browser_args:
+            if pool is not None:
+                pool.close()
+            pool = BrowserPool(
+                partial(_launch_browser, browser_args),
+                size=self.config.browser_pool_size,
+                recycle_after=self.config.browser_recycle_after
+            )
+            # 爬虫实例被回收或进程退出时关闭池中的空闲浏览器；
+            # finalize 只引用浏览器池，不会延长爬虫实例的生命周期
+            weakref.finalize(self, pool.close)
+            self._browser_pool = pool
+            self._browser_pool_args = browser_args
+        return pool
+    
+    def _browser_args(self) -> Tuple[str, ...]:
+        """
+        按配置构建浏览器启动参数
+        
+        @returns {Tuple[str, ...]} Chromium 启动参数
+        """
+        # 构建浏览器配置选项
+        browser_args = []
+        
+        # 无头模式配置
+        if getattr(self.config, 'browser_headless', False):
+            browser_args.append('--headless')
+            self.logger.info("🔇 浏览器将在后台模式运行（不显示窗口）")
+        else:
+            self.logger.info("🖥️  浏览器将在前台模式运行（显示窗口）")
+        
+        # 其他浏览器选项
+        if getattr(self.config, 'browser_disable_dev_shm_usage', True):
+            browser_args.append('--disable-dev-shm-usage')
+        
+        if getattr(self.config, 'browser_no_sandbox', False):
+            browser_args.append('--no-sandbox')
+        
+        # 添加常用的稳定性选项
+        browser_args.extend([
+            '--disable-blink-features=AutomationControlled',
+            '--disable-extensions',
+            '--disable-plugins',
+            '--disable-images',  # 不加载图片以提高速度
+        ])
+        return tuple(browser_args)
+    
+    def close_browsers(self) -> None:
+        """关闭浏览器池中所有空闲的浏览器实例"""
+        if self._browser_pool is not None:
+            self._browser_pool.close()
+    
     @contextmanager
     def get_browser(self):
         """
         获取浏览器实例的上下文管理器
         
-        提供浏览器实例的自动创建和清理，确保资源正确释放。
-        使用上下文管理器模式，支持with语句。
-        支持无头模式和其他浏览器配置选项。
+        默认每次创建新的浏览器实例，退出with块时关闭。
+        配置 browser_pool_size > 0 时从本实例的浏览器池中取出并在退出时归还，
+        多次爬取复用已启动的浏览器，省去每次启动Chromium的开销；
+        每个实例使用 browser_recycle_after 次后由池关闭并重建，避免内存持续增长。
+        with块内发生异常时该实例直接关闭，不再放回池中。
         
         @yields {ChromiumPage} 浏览器实例
         
@@ -143,77 +383,33 @@ class BaseSpider(ABC):
             with self.get_browser() as browser:
                 # 使用浏览器进行页面操作
                 page = browser.get_page()
-                # 浏览器会在退出with块时自动关闭
+                # 退出with块时浏览器被关闭或归还到浏览器池
         """
-        browser = None
+        browser_args = self._browser_args()
+        pool = self._get_browser_pool(browser_args) if self.config.browser_pool_size > 0 else None
         try:
-            self.logger.info("🔄 初始化浏览器...")
-            
-            # 构建浏览器配置选项
-            browser_args = []
-            
-            # 无头模式配置
-            if getattr(self.config, 'browser_headless', False):
-                browser_args.append('--headless')
-                self.logger.info("🔇 浏览器将在后台模式运行（不显示窗口）")
-            else:
-                self.logger.info("🖥️  浏览器将在前台模式运行（显示窗口）")
-            
-            # 其他浏览器选项
-            if getattr(self.config, 'browser_disable_dev_shm_usage', True):
-                browser_args.append('--disable-dev-shm-usage')
-            
-            if getattr(self.config, 'browser_no_sandbox', False):
-                browser_args.append('--no-sandbox')
-            
-            # 添加常用的稳定性选项
-            browser_args.extend([
-                '--disable-blink-features=AutomationControlled',
-                '--disable-extensions',
-                '--disable-plugins',
-                '--disable-images',  # 不加载图片以提高速度
-            ])
-            
-            # 创建浏览器实例
-            if browser_args:
-                try:
-                    # 尝试新版本的导入方式
-                    from DrissionPage import ChromiumOptions
-                except ImportError:
-                    try:
-                        # 尝试旧版本的导入方式
-                        from DrissionPage.configs.chromium_options import ChromiumOptions
-                    except ImportError:
-                        # 如果都失败，使用基本的ChromiumPage
-                        self.logger.warning("无法导入ChromiumOptions，使用默认浏览器配置")
-                        browser = ChromiumPage()
-                        return browser
-                
-                options = ChromiumOptions()
-                for arg in browser_args:
-                    options.set_argument(arg)
-                browser = ChromiumPage(addr_or_opts=options)
-            else:
-                browser = ChromiumPage()
-            
-            self.logger.info("🌐 浏览器就绪")
-            yield browser
+            browser = pool.checkout() if pool is not None else _launch_browser(browser_args)
         except Exception as e:
             self.logger.error(f"浏览器创建失败：{str(e)}")
             raise
+        
+        self.logger.info("🌐 浏览器就绪")
+        healthy = False
+        try:
+            yield browser
+            healthy = True
         finally:
-            if browser:
-                try:
-                    browser.quit()
-                    self.logger.info("🔒 浏览器已关闭")
-                except Exception as e:
-                    self.logger.error(f"关闭浏览器时出现错误：{str(e)}")
+            if pool is not None:
+                pool.checkin(browser, healthy=healthy)
+            else:
+                _quit_browser(browser, self.logger)
     
     def get_request_headers(self, referer: Optional[str] = None) -> Dict[str, str]:
         """
         获取请求头配置
         
         根据配置生成标准的HTTP请求头，包含Cookie、User-Agent等必要信息。
+        返回的是新字典，调用方可以自由修改。
         
         @param {Optional[str]} referer - 引用页面URL，用于设置Referer头
         @returns {Dict[str, str]} 请求头字典
@@ -222,14 +418,9 @@ class BaseSpider(ABC):
             headers = self.get_request_headers("https://www.douyin.com")
             # 结果: {"cookie": "...", "User-Agent": "...", "referer": "..."}
         """
-        headers = {
-            "cookie": self.config.cookie,
-            "User-Agent": self.config.user_agent,
-        }
-        
+        headers = dict(self._base_headers)
         if referer:
             headers["referer"] = referer
-            
         return headers
     
     def retry_on_failure(self, max_retries: int = None, delay: int = None):
@@ -249,28 +440,46 @@ class BaseSpider(ABC):
                 # 这个方法会在失败时自动重试3次
                 pass
         """
-        if max_retries is None:
-            max_retries = self.config.hot_list_max_retries
-        if delay is None:
-            delay = self.config.hot_list_delay
-            
         def decorator(func):
             def wrapper(*args, **kwargs):
-                last_exception = None
-                for attempt in range(max_retries):
-                    try:
-                        return func(*args, **kwargs)
-                    except Exception as e:
-                        last_exception = e
-                        if attempt < max_retries - 1:
-                            self.logger.warning(f"{func.__name__} 第{attempt + 1}次尝试失败，{delay}秒后重试... 错误：{str(e)}")
-                            time.sleep(delay)
-                        else:
-                            self.logger.error(f"{func.__name__} 经过{max_retries}次尝试后仍然失败")
-                raise last_exception
+                return self.call_with_retry(func, *args, max_retries=max_retries, delay=delay, **kwargs)
             return wrapper
         return decorator
     
+    def call_with_retry(self, func: Callable[..., Any], *args, max_retries: int = None, delay: int = None, **kwargs) -> Any:
+        """
+        调用函数，失败时按间隔重试
+        
+        与 retry_on_failure 行为相同，但无需为每次调用创建装饰器和包装函数，
+        适合在循环中反复调用。至少执行一次。
+        
+        @param {Callable} func - 要调用的函数
+        @param {int} max_retries - 最大尝试次数，如果为None则使用配置中的值
+        @param {int} delay - 重试间隔时间（秒），如果为None则使用配置中的值
+        @returns {Any} 函数返回值
+        
+        @throws {Exception} 所有尝试均失败时抛出最后一次的异常
+        
+        @example
+            data = self.call_with_retry(self._fetch_page, browser, url, max_retries=3, delay=2)
+        """
+        if max_retries is None:
+            max_retries = self.config.hot_list_max_retries
+        if delay is None:
+            delay = self.config.hot_list_delay
+        
+        attempts = max(max_retries, 1)
+        for attempt in range(attempts):
+            try:
+                return func(*args, **kwargs)
+            except Exception as e:
+                if attempt < attempts - 1:
+                    self.logger.warning(f"{func.__name__} 第{attempt + 1}次尝试失败，{delay}秒后重试... 错误：{str(e)}")
+                    time.sleep(delay)
+                else:
+                    self.logger.error(f"{func.__name__} 经过{attempts}次尝试后仍然失败")
+                    raise
+    
     def safe_get_nested_value(self, data: Dict[str, Any], keys: List[Any], default: Any = None) -> Any:
         """
         安全地获取嵌套字典的值
@@ -317,26 +526,8 @@ class BaseSpider(ABC):
         if not isinstance(text, str):
             text = str(text)
         
-        # 去除首尾空白
-        text = text.strip()
-        
-        # 替换特殊字符
-        replacements = {
-            '\n': ' ',      # 换行符
-            '\r': ' ',      # 回车符
-            '\t': ' ',      # 制表符
-            '\u200b': '',   # 零宽度空格
-            '\ufeff': '',   # BOM字符
-        }
-        
-        for old, new in replacements.items():
-            text = text.replace(old, new)
-        
-        # 压缩连续空格
-        import re
-        text = re.sub(r'\s+', ' ', text)
-        
-        return text.strip()
+        # 一次 translate 替换/删除所有特殊字符，再压缩连续空白
+        return _WHITESPACE_RE.sub(' ', text.translate(_CLEAN_TEXT_TABLE)).strip()
     
     def sanitize_url(self, url: str) -> str:
         """
@@ -363,11 +554,7 @@ class BaseSpider(ABC):
             return ""
             
         # 移除潜在的恶意字符
-        dangerous_chars = ['"', "'", '<', '>', '`', '\n', '\r', '\t']
-        for char in dangerous_chars:
-            url = url.replace(char, '')
-        
-        return url
+        return url.translate(_URL_DANGEROUS_CHARS_TABLE)
     
     def record_request(self, success: bool = True, duration: float = 0.0) -> None:
         """
@@ -390,11 +577,12 @@ class BaseSpider(ABC):
                 duration = time.time() - start_time
                 self.record_request(success=False, duration=duration)
         """
-        self._request_count += 1
-        if success:
-            self._success_count += 1
-        else:
-            self._error_count += 1
+        with self._stats_lock:
+            self._request_count += 1
+            if success:
+                self._success_count += 1
+            else:
+                self._error_count += 1
             
         # 如果存在性能监控器，则记录到性能监控器
         if hasattr(self, 'perf_monitor') and self.perf_monitor:
@@ -23,12 +23,29 @@
 """
 import time
 import json
+import queue
 import traceback
-from typing import Optional, Dict, Any, List
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, Dict, Any, List, Tuple
 from datetime import datetime
 
-from .base_spider import BaseSpider
-from ..core.constants import Constants
+from .base_spider import BaseSpider, compile_path
+from ..core.constants import (
+    API_AWEME_DETAIL,
+    API_SEARCH_LIST,
+    AWEME_DETAIL_FIELD,
+    AWEME_ID_FIELD,
+    DATA_FIELD,
+    DESC_FIELD,
+    HOT_LIST_ITEM_REQUIRED_FIELDS,
+    HOT_VALUE_FIELD,
+    POSITION_FIELD,
+    SENTENCE_ID_FIELD,
+    VIDEO_PLAY_URL_PATH,
+    VIEW_COUNT_FIELD,
+    WORD_FIELD,
+    WORD_LIST_FIELD,
+)
 from ..core.models import HotListResponse, HotListItem, VideoArticle, CrawlResult
 from ..core.exceptions import (
     NetworkException, RequestTimeoutException, ConnectionException, RateLimitException,
@@ -41,6 +58,18 @@ from ..config.config_manager import AppConfig
 from ..utils.performance import CacheManager, RateLimiter
 from ..utils.video_downloader import VideoDownloader
 
+# orjson 为可选依赖，存在时用于解析以字符串形式返回的视频详情响应体。
+# orjson.loads 直接接受 str，其 JSONDecodeError 是 json.JSONDecodeError 的子类
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+
+# 视频详情中首个播放地址的取值函数（路径固定，导入时编译一次）
+_get_video_play_url = compile_path(VIDEO_PLAY_URL_PATH)
+
 
 class DouyinSpider(BaseSpider):
     """
@@ -101,6 +130,16 @@ class DouyinSpider(BaseSpider):
         self.cache_manager = cache_manager
         self.rate_limiter = rate_limiter
         
+        # 视频详情缓存：与结果缓存共用过期时间，但只保存在内存中。
+        # 详情原始数据体积较大，写入持久化缓存会让每次插入都重写整个缓存文件
+        self._detail_cache: Optional[CacheManager] = None
+        if cache_manager is not None:
+            self._detail_cache = CacheManager(
+                max_size=max(config.max_items * 2, 100),
+                ttl=cache_manager.ttl,
+                enable_persistence=False
+            )
+        
         # 初始化视频下载器（如果启用）
         self.video_downloader = None
         if getattr(config, 'video_download_enabled', False):
@@ -169,21 +208,22 @@ class DouyinSpider(BaseSpider):
                     )
                 
                 # 提取热榜数据
-                hot_list_data = hot_list_json.get(Constants.DATA_FIELD)
+                hot_list_data = hot_list_json.get(DATA_FIELD)
                 if not hot_list_data:
                     return CrawlResult(
                         success=False,
-                        error_message=f"热榜数据格式异常：缺少{Constants.DATA_FIELD}字段",
+                        error_message=f"热榜数据格式异常：缺少{DATA_FIELD}字段",
                         execution_time=time.time() - start_time
                     )
                 
-                # 创建响应对象
+                # 创建响应对象；本次爬取的所有项目共用同一个创建时间
+                crawl_ts = datetime.now()
                 hot_list_response = HotListResponse(
-                    fetch_time=datetime.now()
+                    fetch_time=crawl_ts
                 )
                 
                 # 处理热榜项目
-                hot_items_list = hot_list_data.get(Constants.WORD_LIST_FIELD, [])
+                hot_items_list = hot_list_data.get(WORD_LIST_FIELD, [])
                 if not hot_items_list:
                     return CrawlResult(
                         success=False,
@@ -196,30 +236,43 @@ class DouyinSpider(BaseSpider):
                     hot_items_list = hot_items_list[1:]
                     self.logger.info("⏭️  跳过置顶数据")
                 
-                # 处理每个热榜项目
-                for i, hot_item_data in enumerate(hot_items_list):
-                    # 检查是否达到最大项目数限制
-                    if i >= self.config.max_items:
-                        break
-                    
-                    items_processed += 1
-                    
-                    try:
-                        # 处理单个热榜项目
-                        hot_item = self._process_hot_list_item(hot_item_data, browser)
+                # 处理每个热榜项目：启用并发请求时由多个浏览器标签页并行获取视频详情，
+                # 否则逐项顺序处理
+                if self.config.concurrent_requests and self.config.max_concurrent_workers > 1:
+                    hot_items_list = hot_items_list[:self.config.max_items]
+                    items_processed = len(hot_items_list)
+                    hot_items = self._process_hot_list_items_concurrently(hot_items_list, browser, crawl_ts)
+                    for i, hot_item in enumerate(hot_items):
                         if hot_item:
                             hot_list_response.items.append(hot_item)
                             items_success += 1
                             self.logger.info(f"✅ [{i+1}] {hot_item.title}")
                         else:
                             self.logger.warning(f"❌ [{i+1}] 处理失败")
-                    except Exception as e:
-                        self.logger.error(f"❌ [{i+1}] 处理出错: {str(e)}")
-                        continue
+                else:
+                    for i, hot_item_data in enumerate(hot_items_list):
+                        # 检查是否达到最大项目数限制
+                        if i >= self.config.max_items:
+                            break
+                    
+                        items_processed += 1
                     
-                    # 请求间隔控制
-                    if i < len(hot_items_list) - 1 and self.config.request_interval > 0:
-                        time.sleep(self.config.request_interval)
+                        try:
+                            # 处理单个热榜项目
+                            hot_item = self._process_hot_list_item(hot_item_data, browser, crawl_ts)
+                            if hot_item:
+                                hot_list_response.items.append(hot_item)
+                                items_success += 1
+                                self.logger.info(f"✅ [{i+1}] {hot_item.title}")
+                            else:
+                                self.logger.warning(f"❌ [{i+1}] 处理失败")
+                        except Exception as e:
+                            self.logger.error(f"❌ [{i+1}] 处理出错: {str(e)}")
+                            continue
+                    
+                        # 请求间隔控制
+                        if i < len(hot_items_list) - 1 and self.config.request_interval > 0:
+                            time.sleep(self.config.request_interval)
                 
                 # 如果启用了视频下载功能，执行批量下载
                 if self.video_downloader and hot_list_response.items:
@@ -260,68 +313,11 @@ class DouyinSpider(BaseSpider):
         Returns:
             Dict[str, Any]: 热榜数据
         """
-        @self.retry_on_failure(
+        return self.call_with_retry(
+            self._request_hot_list_data, browser,
             max_retries=self.config.hot_list_max_retries,
             delay=self.config.hot_list_delay
         )
-        def _fetch():
-            request_start = time.time()
-            try:
-                browser.listen.start(Constants.API_SEARCH_LIST)
-                browser.get(self.config.hot_list_url)
-                response = browser.listen.wait(timeout=self.config.hot_list_timeout)
-                
-                if response is None:
-                    raise RequestTimeoutException(
-                        "热榜请求超时",
-                        context={
-                            "url": self.config.hot_list_url,
-                            "timeout": self.config.hot_list_timeout
-                        }
-                    )
-                    
-                data = response.response.body
-                if data is None:
-                    raise EmptyDataException(
-                        "热榜响应体为空",
-                        context={"url": self.config.hot_list_url}
-                    )
-                    
-                request_duration = time.time() - request_start
-                self.logger.info(f"✅ 热榜数据获取成功 ({request_duration:.2f}秒)")
-                
-                # 记录请求统计
-                self.record_request(True, request_duration)
-                
-                return data
-            except (RequestTimeoutException, EmptyDataException):
-                # 重新抛出自定义异常
-                request_duration = time.time() - request_start
-                self.record_request(False, request_duration)
-                raise
-            except Exception as e:
-                request_duration = time.time() - request_start
-                self.logger.error(f"❌ 获取热榜数据失败 ({request_duration:.2f}秒): {str(e)}")
-                self.record_request(False, request_duration)
-                
-                # 根据错误类型创建相应的异常
-                if "timeout" in str(e).lower():
-                    raise RequestTimeoutException(
-                        f"网络请求超时: {str(e)}",
-                        context={"url": self.config.hot_list_url, "original_error": str(e)}
-                    )
-                elif "connection" in str(e).lower():
-                    raise ConnectionException(
-                        f"连接失败: {str(e)}",
-                        context={"url": self.config.hot_list_url, "original_error": str(e)}
-                    )
-                else:
-                    raise NetworkException(
-                        f"网络请求失败: {str(e)}",
-                        context={"url": self.config.hot_list_url, "original_error": str(e)}
-                    )
-        
-        return _fetch()
     
     def _fetch_video_detail(self, browser, url: str) -> Optional[Dict[str, Any]]:
         """
@@ -332,64 +328,208 @@ class DouyinSpider(BaseSpider):
         Returns:
             Dict[str, Any]: 视频详情数据
         """
-        @self.retry_on_failure(
+        return self.call_with_retry(
+            self._request_video_detail, browser, url,
             max_retries=self.config.video_detail_max_retries,
             delay=self.config.video_detail_delay
         )
-        def _fetch():
-            request_start = time.time()
-            try:
-                # 简化视频详情获取日志
-                browser.listen.start(Constants.API_AWEME_DETAIL)
-                browser.get(url)
-                response = browser.listen.wait(timeout=self.config.video_detail_timeout)
+    
+    def _get_video_detail(self, browser, item_id: str, url: str) -> Optional[Dict[str, Any]]:
+        """
+        获取视频详情数据，优先使用按热榜项目ID缓存的结果
+        
+        热榜在相邻几次爬取之间大部分条目相同，按 item_id 缓存详情
+        可以跳过对仍在榜视频的重复请求。只缓存成功获取的详情，
+        且只保存在内存中的详情缓存里，不写入持久化的结果缓存。
+        Args:
+            browser: 浏览器实例
+            item_id: 热榜项目ID
+            url: 视频URL
+        Returns:
+            Dict[str, Any]: 视频详情数据
+        """
+        if not (self._detail_cache and self.config.enable_cache):
+            return self._fetch_video_detail(browser, url)
+        
+        detail_key = f"vd_{item_id}"
+        video_detail_json = self._detail_cache.get(detail_key)
+        if video_detail_json is not None:
+            self.logger.debug(f"💾 使用缓存的视频详情：{item_id}")
+            return video_detail_json
+        
+        video_detail_json = self._fetch_video_detail(browser, url)
+        if video_detail_json is not None:
+            self._detail_cache.set(detail_key, video_detail_json)
+        return video_detail_json
+    
+    def _request_hot_list_data(self, browser) -> Any:
+        """
+        发起一次热榜数据请求（由 _fetch_hot_list_data 按配置重试）
+        Args:
+            browser: 浏览器实例
+        Returns:
+            Any: 热榜接口响应体
+        """
+        request_start = time.time()
+        try:
+            browser.listen.start(API_SEARCH_LIST)
+            browser.get(self.config.hot_list_url)
+            response = browser.listen.wait(timeout=self.config.hot_list_timeout)
+            
+            if response is None:
+                raise RequestTimeoutException(
+                    "热榜请求超时",
+                    context={
+                        "url": self.config.hot_list_url,
+                        "timeout": self.config.hot_list_timeout
+                    }
+                )
                 
-                if response is None:
-                    self.logger.warning("获取视频详情超时")
-                    request_duration = time.time() - request_start
-                    self.record_request(False, request_duration)
-                    return None
-                    
-                data = response.response.body
-                if data is None:
-                    self.logger.warning("视频详情响应体为空")
-                    request_duration = time.time() - request_start
-                    self.record_request(False, request_duration)
-                    return None
-                    
+            data = response.response.body
+            if data is None:
+                raise EmptyDataException(
+                    "热榜响应体为空",
+                    context={"url": self.config.hot_list_url}
+                )
+                
+            request_duration = time.time() - request_start
+            self.logger.info(f"✅ 热榜数据获取成功 ({request_duration:.2f}秒)")
+            
+            # 记录请求统计
+            self.record_request(True, request_duration)
+            
+            return data
+        except (RequestTimeoutException, EmptyDataException):
+            # 重新抛出自定义异常
+            request_duration = time.time() - request_start
+            self.record_request(False, request_duration)
+            raise
+        except Exception as e:
+            request_duration = time.time() - request_start
+            self.logger.error(f"❌ 获取热榜数据失败 ({request_duration:.2f}秒): {str(e)}")
+            self.record_request(False, request_duration)
+            
+            # 根据错误类型创建相应的异常
+            if "timeout" in str(e).lower():
+                raise RequestTimeoutException(
+                    f"网络请求超时: {str(e)}",
+                    context={"url": self.config.hot_list_url, "original_error": str(e)}
+                )
+            elif "connection" in str(e).lower():
+                raise ConnectionException(
+                    f"连接失败: {str(e)}",
+                    context={"url": self.config.hot_list_url, "original_error": str(e)}
+                )
+            else:
+                raise NetworkException(
+                    f"网络请求失败: {str(e)}",
+                    context={"url": self.config.hot_list_url, "original_error": str(e)}
+                )
+    
+    def _request_video_detail(self, browser, url: str) -> Optional[Dict[str, Any]]:
+        """
+        发起一次视频详情请求（由 _fetch_video_detail 按配置重试）
+        Args:
+            browser: 浏览器实例
+            url: 视频URL
+        Returns:
+            Dict[str, Any]: 视频详情数据，失败时为None
+        """
+        request_start = time.time()
+        try:
+            # 简化视频详情获取日志
+            browser.listen.start(API_AWEME_DETAIL)
+            browser.get(url)
+            response = browser.listen.wait(timeout=self.config.video_detail_timeout)
+            
+            if response is None:
+                self.logger.warning("获取视频详情超时")
                 request_duration = time.time() - request_start
-                # 记录成功请求
-                self.record_request(True, request_duration)
-                return data
-            except Exception as e:
+                self.record_request(False, request_duration)
+                return None
+                
+            data = response.response.body
+            if data is None:
+                self.logger.warning("视频详情响应体为空")
                 request_duration = time.time() - request_start
-                self.logger.error(f"❌ 获取视频详情失败: {str(e)}")
                 self.record_request(False, request_duration)
                 return None
+                
+            request_duration = time.time() - request_start
+            # 记录成功请求
+            self.record_request(True, request_duration)
+            return data
+        except Exception as e:
+            request_duration = time.time() - request_start
+            self.logger.error(f"❌ 获取视频详情失败: {str(e)}")
+            self.record_request(False, request_duration)
+            return None
+    
+    def _process_hot_list_items_concurrently(self, items_data: List[Dict[str, Any]], browser, created_at: Optional[datetime] = None) -> List[Optional[HotListItem]]:
+        """
+        并发处理多个热榜项目
+        
+        视频详情的获取以等待页面和接口响应为主，为每个工作线程打开一个独立的
+        浏览器标签页，各自监听并获取视频详情，总耗时接近单项耗时而非逐项累加。
+        每个标签页在两次请求之间仍遵守 request_interval 间隔。
+        
+        @param {List[Dict[str, Any]]} items_data - 热榜项目数据列表
+        @param {ChromiumPage} browser - 浏览器实例，用于创建标签页
+        @param {datetime} created_at - 各项目的创建时间，为None时使用当前时间
+        @returns {List[Optional[HotListItem]]} 与输入顺序一致的处理结果，失败项为None
+        """
+        workers = min(self.config.max_concurrent_workers, len(items_data))
+        if workers <= 1:
+            return [self._process_hot_list_item(item_data, browser, created_at) for item_data in items_data]
+        
+        # 空闲标签页队列：每个任务取出一个标签页独占使用，完成后放回
+        tabs: "queue.Queue" = queue.Queue()
+        
+        def process(item_data: Dict[str, Any]) -> Optional[HotListItem]:
+            tab = tabs.get()
+            try:
+                return self._process_hot_list_item(item_data, tab, created_at)
+            finally:
+                if self.config.request_interval > 0:
+                    time.sleep(self.config.request_interval)
+                tabs.put(tab)
         
-        return _fetch()
+        try:
+            # 在 try 内创建标签页，创建中途失败时已创建的标签页同样会被关闭
+            for _ in range(workers):
+                tabs.put(browser.new_tab())
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                return list(executor.map(process, items_data))
+        finally:
+            while not tabs.empty():
+                try:
+                    tabs.get_nowait().close()
+                except Exception as e:
+                    self.logger.debug(f"关闭标签页时出现错误：{str(e)}")
     
-    def _process_hot_list_item(self, item_data: Dict[str, Any], browser) -> Optional[HotListItem]:
+    def _process_hot_list_item(self, item_data: Dict[str, Any], browser, created_at: Optional[datetime] = None) -> Optional[HotListItem]:
         """
         处理热榜项目
         Args:
             item_data: 热榜项目数据
             browser: 浏览器实例
+            created_at: 创建时间，为None时使用当前时间
         Returns:
             HotListItem: 处理后的热榜项目
         """
+        if created_at is None:
+            created_at = datetime.now()
+        
         try:
-            # 验证数据完整性
-            if not self._validate_hot_list_item(item_data):
+            # 验证数据完整性，同时取得已转换的字段值
+            parsed = self._parse_hot_list_item(item_data)
+            if parsed is None:
                 self.logger.warning("热榜项目数据验证失败，跳过...")
                 return None
             
             # 提取基本信息
-            item_id = item_data.get(Constants.SENTENCE_ID_FIELD)
-            item_title = self.clean_text(item_data.get(Constants.WORD_FIELD))
-            item_position = int(item_data.get(Constants.POSITION_FIELD))
-            item_popularity = int(item_data.get(Constants.HOT_VALUE_FIELD))
-            item_views = int(item_data.get(Constants.VIEW_COUNT_FIELD))
+            item_id, raw_title, item_position, item_popularity, item_views = parsed
+            item_title = self.clean_text(raw_title)
             
             # 先构建热榜页面URL用于获取视频详情
             from ..utils.formatters import create_encrypted_url
@@ -408,17 +548,23 @@ class DouyinSpider(BaseSpider):
             self.logger.debug(f"位置：{item_position}, 热度：{item_popularity}, 浏览量：{item_views}")
             
             # 获取视频详情以获得视频短链接
-            video_detail_json = self._fetch_video_detail(browser, hot_list_page_url)
+            video_detail_json = self._get_video_detail(browser, item_id, hot_list_page_url)
             
-            # 获取视频短链接
+            # 获取视频短链接：只要详情中有视频ID就构建短链接，
+            # 与视频文章能否通过校验（例如描述为空）无关
             video_short_url = None
+            video_article = None
             if video_detail_json is not None:
-                # 从视频详情中提取视频ID来构建短链接
-                video_detail_data = video_detail_json.get(Constants.AWEME_DETAIL_FIELD)
-                if video_detail_data:
-                    video_id = str(video_detail_data.get(Constants.AWEME_ID_FIELD, "")).strip()
-                    if video_id:
-                        video_short_url = f"{self.config.video_url}/{video_id}"
+                if isinstance(video_detail_json, str):
+                    video_detail_json = self._decode_video_detail(video_detail_json)
+                if isinstance(video_detail_json, dict):
+                    video_detail_data = video_detail_json.get(AWEME_DETAIL_FIELD)
+                    if video_detail_data:
+                        video_id = str(video_detail_data.get(AWEME_ID_FIELD, "")).strip()
+                        if video_id:
+                            video_short_url = f"{self.config.video_url}/{video_id}"
+                    # 详情已解码，文章字段直接从同一份数据提取
+                    video_article = self._process_video_detail(video_detail_json, created_at)
             
             # 如果没有获取到视频短链接，使用热榜页面URL作为备选
             item_url = video_short_url if video_short_url else hot_list_page_url
@@ -430,15 +576,11 @@ class DouyinSpider(BaseSpider):
                 url=item_url,  # 现在这里存储的是视频短链接
                 popularity=item_popularity,
                 views=item_views,
-                created_at=datetime.now()
+                created_at=created_at
             )
             
-            # 重用已获取的视频详情数据
-            if video_detail_json is not None:
-                # 处理视频详情数据
-                video_article = self._process_video_detail(video_detail_json)
-                if video_article:
-                    hot_list_item.articles.append(video_article)
+            if video_article:
+                hot_list_item.articles.append(video_article)
             
             return hot_list_item
             
@@ -446,26 +588,24 @@ class DouyinSpider(BaseSpider):
             self.logger.error(f"处理热榜项目时发生异常：{str(e)}")
             return None
     
-    def _process_video_detail(self, video_detail_json: Dict[str, Any]) -> Optional[VideoArticle]:
+    def _process_video_detail(self, video_detail_json: Dict[str, Any], created_at: Optional[datetime] = None) -> Optional[VideoArticle]:
         """
         处理视频详情数据
         Args:
             video_detail_json: 视频详情JSON数据
+            created_at: 创建时间，为None时使用当前时间
         Returns:
             VideoArticle: 视频文章对象
         """
         try:
             # 处理返回数据格式问题
             if isinstance(video_detail_json, str):
-                if not video_detail_json.strip():
-                    return None
-                try:
-                    video_detail_json = json.loads(video_detail_json)
-                except json.JSONDecodeError:
+                video_detail_json = self._decode_video_detail(video_detail_json)
+                if video_detail_json is None:
                     return None
             
             # 检查并提取视频详情数据
-            video_detail_data = video_detail_json.get(Constants.AWEME_DETAIL_FIELD)
+            video_detail_data = video_detail_json.get(AWEME_DETAIL_FIELD)
             if not video_detail_data:
                 return None
             
@@ -474,8 +614,8 @@ class DouyinSpider(BaseSpider):
                 return None
             
             # 提取视频信息
-            video_id = str(video_detail_data.get(Constants.AWEME_ID_FIELD)).strip()
-            video_title = self.clean_text(video_detail_data.get(Constants.DESC_FIELD, ""))
+            video_id = str(video_detail_data.get(AWEME_ID_FIELD)).strip()
+            video_title = self.clean_text(video_detail_data.get(DESC_FIELD, ""))
             
             if not video_id:
                 return None
@@ -483,11 +623,7 @@ class DouyinSpider(BaseSpider):
             video_short_url = f"{self.config.video_url}/{video_id}"
             
             # 安全地获取视频URL
-            raw_video_url = self.safe_get_nested_value(
-                video_detail_data, 
-                [Constants.VIDEO_FIELD, Constants.BIT_RATE_FIELD, 0, Constants.PLAY_ADDR_FIELD, Constants.URL_LIST_FIELD, 0],
-                ""
-            )
+            raw_video_url = _get_video_play_url(video_detail_data, "")
             
             # 清洗视频URL
             video_play_url = self.sanitize_url(raw_video_url) if raw_video_url else ""
@@ -497,51 +633,72 @@ class DouyinSpider(BaseSpider):
                 title=video_title,
                 short_url=video_short_url,
                 video_url=video_play_url,
-                created_at=datetime.now()
+                created_at=created_at if created_at is not None else datetime.now()
             )
             
         except Exception as e:
             self.logger.error(f"处理视频详情时发生异常：{str(e)}")
             return None
     
-    def _validate_hot_list_item(self, item: Dict[str, Any]) -> bool:
+    @staticmethod
+    def _decode_video_detail(body: str) -> Optional[Dict[str, Any]]:
         """
-        验证热榜项目数据完整性
+        解析以字符串形式返回的视频详情响应体
         Args:
-            item: 热榜项目数据
+            body: 响应体字符串
         Returns:
-            bool: 数据是否有效
+            Dict[str, Any]: 解析后的数据，空串或非法JSON时为None
+        """
+        if not body.strip():
+            return None
+        try:
+            return _json_loads(body)
+        except json.JSONDecodeError:
+            return None
+    
+    def _parse_hot_list_item(self, item: Dict[str, Any]) -> Optional[Tuple[Any, Any, int, int, int]]:
         """
-        required_fields = [
-            Constants.SENTENCE_ID_FIELD,
-            Constants.WORD_FIELD,
-            Constants.POSITION_FIELD,
-            Constants.HOT_VALUE_FIELD,
-            Constants.VIEW_COUNT_FIELD
-        ]
+        验证热榜项目数据完整性并提取字段
         
-        for field in required_fields:
-            if field not in item or item[field] is None:
-                return False
+        每个字段只从字典中取一次，数值字段只转换一次，
+        处理热榜项目时直接使用返回的结果，无需再次取值和转换。
+        Args:
+            item: 热榜项目数据
+        Returns:
+            Optional[Tuple]: (项目ID, 原始标题, 排名, 热度, 浏览量)，数据无效时为None
+        """
+        for field in HOT_LIST_ITEM_REQUIRED_FIELDS:
+            if item.get(field) is None:
+                return None
         
         # 验证数据类型
         try:
-            position = int(item[Constants.POSITION_FIELD])
-            hot_value = int(item[Constants.HOT_VALUE_FIELD])
-            view_count = int(item[Constants.VIEW_COUNT_FIELD])
-            
-            if position <= 0 or hot_value < 0 or view_count < 0:
-                return False
-                
+            position = int(item[POSITION_FIELD])
+            hot_value = int(item[HOT_VALUE_FIELD])
+            view_count = int(item[VIEW_COUNT_FIELD])
         except (ValueError, TypeError):
-            return False
+            return None
+        
+        if position <= 0 or hot_value < 0 or view_count < 0:
+            return None
         
         # 验证标题长度
-        title = str(item[Constants.WORD_FIELD]).strip()
-        if len(title) == 0 or len(title) > 200:
-            return False
+        raw_title = item[WORD_FIELD]
+        title_length = len(str(raw_title).strip())
+        if title_length == 0 or title_length > 200:
+            return None
             
-        return True
+        return item[SENTENCE_ID_FIELD], raw_title, position, hot_value, view_count
+    
+    def _validate_hot_list_item(self, item: Dict[str, Any]) -> bool:
+        """
+        验证热榜项目数据完整性
+        Args:
+            item: 热榜项目数据
+        Returns:
+            bool: 数据是否有效
+        """
+        return self._parse_hot_list_item(item) is not None
     
     def _validate_video_data(self, video_data: Dict[str, Any]) -> bool:
         """
@@ -555,10 +712,10 @@ class DouyinSpider(BaseSpider):
             return False
             
         # 检查必要字段
-        if Constants.AWEME_ID_FIELD not in video_data:
+        if AWEME_ID_FIELD not in video_data:
             return False
             
-        aweme_id = video_data.get(Constants.AWEME_ID_FIELD)
+        aweme_id = video_data.get(AWEME_ID_FIELD)
         if not aweme_id or not str(aweme_id).strip():
             return False
             
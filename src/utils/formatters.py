@@ -296,40 +296,42 @@ def convert_to_markdown(hot_list_response) -> str:
         with open('output.md', 'w', encoding='utf-8') as f:
             f.write(markdown_content)
     """
-    lines = []
-    lines.append("# 抖音热榜数据")
-    lines.append("")
-    lines.append(f"**生成时间**: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-    lines.append("")
+    lines = [
+        "# 抖音热榜数据",
+        "",
+        f"**生成时间**: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}",
+        "",
+    ]
+    # 循环中反复调用，预先绑定方法避免逐次属性查找
+    append = lines.append
+    extend = lines.extend
     
     for item in hot_list_response.items:
-        lines.append(f"## {item.position}. {item.title}")
-        lines.append("")
-        lines.append(f"- **热度**: {format_number(item.popularity)}")
-        lines.append(f"- **浏览量**: {format_number(item.views)}")
-        lines.append(f"- **链接**: [{item.url}]({item.url})")
-        lines.append("")
+        extend((
+            f"## {item.position}. {item.title}",
+            "",
+            f"- **热度**: {format_number(item.popularity)}",
+            f"- **浏览量**: {format_number(item.views)}",
+            f"- **链接**: [{item.url}]({item.url})",
+            "",
+            "### 相关视频",
+            "",
+        ))
         
         if item.articles:
-            lines.append("### 相关视频")
-            lines.append("")
             for i, article in enumerate(item.articles, 1):
-                lines.append(f"#### {i}. {article.title}")
-                lines.append("")
+                append(f"#### {i}. {article.title}")
+                append("")
                 if article.video_url:
-                    lines.append(f"- **链接**: [{article.video_url}]({article.video_url})")
-                    lines.append(f"- **视频**: [点击播放]({article.video_url})")
+                    append(f"- **链接**: [{article.video_url}]({article.video_url})")
+                    append(f"- **视频**: [点击播放]({article.video_url})")
                 else:
-                    lines.append(f"- **链接**: [{article.short_url}]({article.short_url})")
-                lines.append("")
+                    append(f"- **链接**: [{article.short_url}]({article.short_url})")
+                append("")
         else:
-            lines.append("### 相关视频")
-            lines.append("")
-            lines.append("*暂无相关视频*")
-            lines.append("")
+            extend(("*暂无相关视频*", ""))
         
-        lines.append("---")
-        lines.append("")
+        extend(("---", ""))
     
     return "\n".join(lines)
 
@@ -346,9 +348,9 @@ def convert_to_csv(hot_list_response) -> str:
         with open('output.csv', 'w', encoding='utf-8') as f:
             f.write(csv_content)
     """
-    lines = []
     # CSV头部
-    lines.append("排名,标题,热度,浏览量,链接,视频下载链接")
+    lines = ["排名,标题,热度,浏览量,链接,视频下载链接"]
+    append = lines.append
     
     for item in hot_list_response.items:
         # 处理CSV中的特殊字符（逗号、引号等）
@@ -361,7 +363,7 @@ def convert_to_csv(hot_list_response) -> str:
         if item.articles and len(item.articles) > 0:
             video_download_url = item.articles[0].video_url or ""
         
-        lines.append(f"{item.position},{title},{item.popularity},{item.views},{item.url},{video_download_url}")
+        append(f"{item.position},{title},{item.popularity},{item.views},{item.url},{video_download_url}")
     
     return "\n".join(lines)
 
@@ -378,32 +380,36 @@ def convert_to_txt(hot_list_response) -> str:
         with open('output.txt', 'w', encoding='utf-8') as f:
             f.write(txt_content)
     """
-    lines = []
-    lines.append("抖音热榜数据")
-    lines.append("=" * 50)
-    lines.append(f"生成时间: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-    lines.append("")
+    lines = [
+        "抖音热榜数据",
+        "=" * 50,
+        f"生成时间: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}",
+        "",
+    ]
+    # 循环中反复调用，预先绑定方法避免逐次属性查找
+    append = lines.append
+    extend = lines.extend
     
     for item in hot_list_response.items:
-        lines.append(f"{item.position}. {item.title}")
-        lines.append(f"   热度: {format_number(item.popularity)}")
-        lines.append(f"   浏览量: {format_number(item.views)}")
-        lines.append(f"   链接: {item.url}")
-        lines.append("")
+        extend((
+            f"{item.position}. {item.title}",
+            f"   热度: {format_number(item.popularity)}",
+            f"   浏览量: {format_number(item.views)}",
+            f"   链接: {item.url}",
+            "",
+        ))
         
         if item.articles:
-            lines.append("   相关视频:")
+            append("   相关视频:")
             for i, article in enumerate(item.articles, 1):
-                lines.append(f"   {i}. {article.title}")
-                lines.append(f"      链接: {article.short_url}")
+                append(f"   {i}. {article.title}")
+                append(f"      链接: {article.short_url}")
                 if article.video_url:
-                    lines.append(f"      视频: {article.video_url}")
-                lines.append("")
+                    append(f"      视频: {article.video_url}")
+                append("")
         else:
-            lines.append("   相关视频: 暂无")
-            lines.append("")
+            extend(("   相关视频: 暂无", ""))
         
-        lines.append("-" * 30)
-        lines.append("")
+        extend(("-" * 30, ""))
     
     return "\n".join(lines)
@@ -0,0 +1,58 @@
+"""
+延迟导入工具模块
+
+@author: MingTechPro
+@version: 1.0.0
+@date: 2025-08-15
+@description: 该模块提供模块级的延迟导入包装器，被包装的模块在首次访问
+             其属性时才真正导入，用于缩短命令行程序的启动时间。
+
+@example
+    formatters = LazyLoader("src.utils.formatters")
+    
+    # 此时 src.utils.formatters 尚未导入
+    csv_content = formatters.convert_to_csv(hot_list_response)  # 首次访问时导入
+"""
+import importlib
+import types
+from typing import Any, List
+
+
+class LazyLoader(types.ModuleType):
+    """
+    延迟加载模块包装器
+    
+    继承自 ModuleType，创建时不执行任何导入；首次访问属性时
+    通过 importlib 导入目标模块，并把模块属性复制到自身，
+    之后的属性访问不再经过 __getattr__。
+    
+    @example
+        formatters = LazyLoader("src.utils.formatters")
+        formatters.convert_to_markdown(hot_list_response)
+    """
+    
+    def __init__(self, name: str):
+        """
+        初始化延迟加载包装器
+        
+        @param {str} name - 目标模块的完整导入路径
+        """
+        super().__init__(name)
+    
+    def _load(self) -> types.ModuleType:
+        """
+        导入目标模块并缓存其属性
+        
+        @returns {ModuleType} 已导入的目标模块
+        """
+        module = importlib.import_module(self.__name__)
+        self.__dict__.update(module.__dict__)
+        return module
+    
+    def __getattr__(self, item: str) -> Any:
+        """首次访问未缓存属性时触发导入"""
+        return getattr(self._load(), item)
+    
+    def __dir__(self) -> List[str]:
+        """返回目标模块的属性列表"""
+        return dir(self._load())
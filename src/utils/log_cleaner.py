@@ -10,6 +10,7 @@
 主要功能:
 - 清理指定天数之前的日志文件
 - 按文件大小清理日志文件
+- 清理内容重复的日志文件
 - 统计日志文件信息
 - 安全的日志清理操作
 
@@ -28,12 +29,22 @@
 """
 
 import os
-import glob
+import fnmatch
+import hashlib
+from bisect import bisect_left
+from itertools import accumulate
+from collections import defaultdict
 from pathlib import Path
 from datetime import datetime, timedelta
 from typing import Dict, List, Tuple
 import logging
 
+# xxhash 为可选依赖，存在时用于加速重复文件检测
+try:
+    import xxhash
+except ImportError:
+    xxhash = None
+
 
 class LogCleaner:
     """
@@ -77,6 +88,27 @@ class LogCleaner:
         # 确保日志目录存在
         self.log_dir.mkdir(parents=True, exist_ok=True)
     
+    def scan_log_files(self, pattern: str = "spider_*.log") -> List[Tuple[str, str, os.stat_result]]:
+        """
+        扫描日志目录
+        
+        使用 os.scandir 单次遍历目录，每个文件的 stat 结果随条目一起返回，
+        调用方排序、统计时无需再次 stat。
+        
+        @param {str} pattern - 文件名匹配模式
+        @returns {List[Tuple[str, str, os.stat_result]]} (文件名, 路径, stat结果) 列表
+        
+        @example
+            for name, path, stat in cleaner.scan_log_files():
+                print(f"{name}: {stat.st_size} 字节")
+        """
+        with os.scandir(self.log_dir) as it:
+            return [
+                (entry.name, entry.path, entry.stat())
+                for entry in it
+                if entry.is_file(follow_symlinks=False) and fnmatch.fnmatch(entry.name, pattern)
+            ]
+    
     def get_log_files(self, pattern: str = "spider_*.log") -> List[Path]:
         """
         获取日志文件列表
@@ -88,8 +120,7 @@ class LogCleaner:
             files = cleaner.get_log_files("spider_*.log")
             print(f"找到 {len(files)} 个日志文件")
         """
-        pattern_path = self.log_dir / pattern
-        return [Path(f) for f in glob.glob(str(pattern_path)) if Path(f).is_file()]
+        return [Path(path) for _, path, _ in self.scan_log_files(pattern)]
     
     def get_log_stats(self) -> Dict:
         """
@@ -102,8 +133,9 @@ class LogCleaner:
             print(f"总文件数: {stats['total_files']}")
             print(f"总大小: {stats['total_size_mb']:.2f}MB")
         """
-        files = self.get_log_files()
-        total_size = sum(f.stat().st_size for f in files)
+        entries = self.scan_log_files()
+        files = [Path(path) for _, path, _ in entries]
+        total_size = sum(stat.st_size for _, _, stat in entries)
         
         # 按时间分组统计
         now = datetime.now()
@@ -112,8 +144,8 @@ class LogCleaner:
         month_files = []
         older_files = []
         
-        for file in files:
-            file_mtime = datetime.fromtimestamp(file.stat().st_mtime)
+        for file, (_, _, stat) in zip(files, entries):
+            file_mtime = datetime.fromtimestamp(stat.st_mtime)
             age_days = (now - file_mtime).days
             
             if age_days == 0:
@@ -153,13 +185,12 @@ class LogCleaner:
             print(f"已删除 {result['deleted_count']} 个文件")
         """
         cutoff_time = datetime.now() - timedelta(days=days)
-        files = self.get_log_files()
+        cutoff_timestamp = cutoff_time.timestamp()
         
-        to_delete = []
-        for file in files:
-            file_mtime = datetime.fromtimestamp(file.stat().st_mtime)
-            if file_mtime < cutoff_time:
-                to_delete.append(file)
+        to_delete = [
+            Path(path) for _, path, stat in self.scan_log_files()
+            if stat.st_mtime < cutoff_timestamp
+        ]
         
         deleted_count = 0
         deleted_files = []
@@ -199,24 +230,22 @@ class LogCleaner:
             result = cleaner.cleanup_by_size(max_size_mb=100)
             print(f"已删除 {result['deleted_count']} 个文件")
         """
-        files = self.get_log_files()
+        entries = self.scan_log_files()
         
         # 按修改时间排序，优先删除旧文件
-        files.sort(key=lambda f: f.stat().st_mtime)
+        entries.sort(key=lambda entry: entry[2].st_mtime)
         
-        total_size = sum(f.stat().st_size for f in files)
+        # 前缀和：cumulative_sizes[k] 为最旧的 k+1 个文件的总大小
+        cumulative_sizes = list(accumulate(stat.st_size for _, _, stat in entries))
+        total_size = cumulative_sizes[-1] if cumulative_sizes else 0
         max_size_bytes = max_size_mb * 1024 * 1024
         
-        to_delete = []
-        current_size = total_size
+        # 二分查找需要删除的最少文件数，使剩余总大小不超过上限
+        delete_count = 0
+        if total_size > max_size_bytes:
+            delete_count = bisect_left(cumulative_sizes, total_size - max_size_bytes) + 1
         
-        for file in files:
-            if current_size <= max_size_bytes:
-                break
-            
-            file_size = file.stat().st_size
-            to_delete.append(file)
-            current_size -= file_size
+        to_delete = [Path(path) for _, path, _ in entries[:delete_count]]
         
         deleted_count = 0
         deleted_files = []
@@ -244,9 +273,82 @@ class LogCleaner:
             "dry_run": dry_run
         }
     
+    @staticmethod
+    def _fingerprint(path: str, size: int, chunk_size: int = 4096) -> bytes:
+        """
+        计算文件的快速指纹（仅读取文件头尾各一块）
+        
+        @param {str} path - 文件路径
+        @param {int} size - 文件大小
+        @param {int} chunk_size - 头尾读取的字节数
+        @returns {bytes} 指纹摘要
+        """
+        hasher = hashlib.blake2b(digest_size=16)
+        with open(path, 'rb') as f:
+            hasher.update(f.read(chunk_size))
+            if size > chunk_size:
+                f.seek(max(size - chunk_size, chunk_size))
+                hasher.update(f.read(chunk_size))
+        return hasher.digest()
+    
+    @staticmethod
+    def _fast_hash(path: str, chunk_size: int = 1 << 20) -> bytes:
+        """
+        计算文件完整内容的哈希值
+        
+        重复检测不需要密码学强度，已安装 xxhash 时使用更快的 xxh3_64，
+        否则回退到标准库的 blake2b。
+        
+        @param {str} path - 文件路径
+        @param {int} chunk_size - 分块读取大小（默认1MB）
+        @returns {bytes} 哈希摘要
+        """
+        hasher = xxhash.xxh3_64() if xxhash is not None else hashlib.blake2b()
+        with open(path, 'rb') as f:
+            for chunk in iter(lambda: f.read(chunk_size), b''):
+                hasher.update(chunk)
+        return hasher.digest()
+    
+    @staticmethod
+    def _group_by(entries: List[Tuple[str, str, os.stat_result]], key) -> List[List[Tuple[str, str, os.stat_result]]]:
+        """
+        按 key 分组并丢弃只有一个成员的分组
+        
+        @param {List[Tuple[str, str, os.stat_result]]} entries - 日志文件条目
+        @param {Callable} key - 分组键函数
+        @returns {List[List[Tuple[str, str, os.stat_result]]]} 成员数大于1的分组
+        """
+        groups = defaultdict(list)
+        for entry in entries:
+            groups[key(entry)].append(entry)
+        return [group for group in groups.values() if len(group) > 1]
+    
+    def find_duplicates(self) -> List[List[Tuple[str, str, os.stat_result]]]:
+        """
+        查找内容完全相同的日志文件
+        
+        逐级筛选：先按文件大小分组，再按头尾指纹分组，只有仍然冲突的文件
+        才计算完整哈希，大小不同的文件完全不需要读取。
+        
+        @returns {List[List[Tuple[str, str, os.stat_result]]]} 重复文件分组
+        
+        @example
+            for group in cleaner.find_duplicates():
+                print([name for name, _, _ in group])
+        """
+        duplicates = []
+        for same_size in self._group_by(self.scan_log_files(), lambda entry: entry[2].st_size):
+            for same_fingerprint in self._group_by(
+                same_size, lambda entry: self._fingerprint(entry[1], entry[2].st_size)
+            ):
+                duplicates.extend(self._group_by(same_fingerprint, lambda entry: self._fast_hash(entry[1])))
+        return duplicates
+    
     def cleanup_duplicates(self, dry_run: bool = False) -> Dict:
         """
-        清理重复的日志文件（基于文件名模式）
+        清理重复的日志文件（基于文件内容）
+        
+        每组内容相同的文件只保留修改时间最新的一个。
         
         @param {bool} dry_run - 试运行模式
         @returns {Dict} 清理结果
@@ -256,23 +358,11 @@ class LogCleaner:
             result = cleaner.cleanup_duplicates()
             print(f"已删除 {result['deleted_count']} 个重复文件")
         """
-        files = self.get_log_files()
-        
-        # 按文件名分组
-        file_groups = {}
-        for file in files:
-            # 提取基础文件名（去掉时间戳）
-            base_name = file.stem.split('_')[0]  # 取spider部分
-            if base_name not in file_groups:
-                file_groups[base_name] = []
-            file_groups[base_name].append(file)
-        
         to_delete = []
-        for base_name, group_files in file_groups.items():
-            if len(group_files) > 1:
-                # 保留最新的文件，删除其他文件
-                group_files.sort(key=lambda f: f.stat().st_mtime, reverse=True)
-                to_delete.extend(group_files[1:])  # 删除除最新文件外的所有文件
+        for group in self.find_duplicates():
+            # 保留最新的文件，删除其他文件
+            group.sort(key=lambda entry: entry[2].st_mtime, reverse=True)
+            to_delete.extend(Path(path) for _, path, _ in group[1:])
         
         deleted_count = 0
         deleted_files = []
@@ -155,12 +155,16 @@ class PerformanceMonitor:
         stats = monitor.get_stats()
     """
     
-    def __init__(self):
+    def __init__(self, monitor_system: bool = True):
         """
         初始化性能监控器
         
         设置监控状态和性能指标收集器。
+        
+        @param {bool} monitor_system - 是否启动系统资源(CPU、内存)采样线程，
+                                       仅需请求统计时可关闭以省去后台线程开销
         """
+        self.monitor_system = monitor_system          # 是否采样系统资源
         self.start_time: Optional[float] = None      # 开始时间
         self.end_time: Optional[float] = None        # 结束时间
         self.metrics = PerformanceMetrics()          # 性能指标
@@ -185,7 +189,8 @@ class PerformanceMonitor:
         self._monitoring = True
         
         # 启动系统资源监控线程
-        self._start_system_monitoring()
+        if self.monitor_system:
+            self._start_system_monitoring()
         
     def end(self) -> None:
         """
@@ -399,10 +404,18 @@ class CacheManager:
                                key=lambda k: self._cache[k]['timestamp'])
                 del self._cache[oldest_key]
             
-            self._cache[key] = {
+            entry = {
                 'value': value,
                 'timestamp': time.time()
             }
+            if self.enable_persistence:
+                # 写入时序列化一次，之后每次保存文件直接复用，
+                # 不再对所有缓存值重复调用 to_dict()
+                try:
+                    entry['serialized'] = self._serialize_value(value)
+                except Exception:
+                    pass
+            self._cache[key] = entry
             
             # 保存到文件
             if self.enable_persistence:
@@ -443,6 +456,21 @@ class CacheManager:
         
         return len(expired_keys)
     
+    @staticmethod
+    def _serialize_value(value: Any) -> Any:
+        """
+        将缓存值转换为可JSON序列化的形式
+        
+        @param {Any} value - 缓存值
+        @returns {Any} 自定义对象转换后的字典，其他值原样返回
+        """
+        # 如果是自定义对象，尝试转换为字典
+        if hasattr(value, 'to_dict'):
+            return value.to_dict()
+        if hasattr(value, '__dict__'):
+            return value.__dict__
+        return value
+    
     def _save_to_file(self) -> None:
         """保存缓存到文件"""
         try:
@@ -451,23 +479,20 @@ class CacheManager:
             # 准备序列化数据
             serializable_cache = {}
             for key, item in self._cache.items():
-                # 尝试序列化值
-                try:
-                    # 如果是自定义对象，尝试转换为字典
-                    if hasattr(item['value'], 'to_dict'):
-                        serializable_value = item['value'].to_dict()
-                    elif hasattr(item['value'], '__dict__'):
-                        serializable_value = item['value'].__dict__
-                    else:
-                        serializable_value = item['value']
-                    
-                    serializable_cache[key] = {
-                        'value': serializable_value,
-                        'timestamp': item['timestamp']
-                    }
-                except Exception:
-                    # 如果无法序列化，跳过该项
-                    continue
+                if 'serialized' in item:
+                    serializable_value = item['serialized']
+                else:
+                    # 尝试序列化值
+                    try:
+                        serializable_value = self._serialize_value(item['value'])
+                    except Exception:
+                        # 如果无法序列化，跳过该项
+                        continue
+                
+                serializable_cache[key] = {
+                    'value': serializable_value,
+                    'timestamp': item['timestamp']
+                }
             
             with open(cache_file, 'w', encoding='utf-8') as f:
                 json.dump(serializable_cache, f, ensure_ascii=False, indent=2)
@@ -497,7 +522,8 @@ class CacheManager:
                         if restored_value is not None:
                             self._cache[key] = {
                                 'value': restored_value,
-                                'timestamp': item['timestamp']
+                                'timestamp': item['timestamp'],
+                                'serialized': item['value']
                             }
                     except Exception:
                         # 如果恢复失败，跳过该项